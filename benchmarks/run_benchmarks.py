@@ -0,0 +1,348 @@
+"""
+======================================================================
+Benchmark Suite for the Numerical Methods Collection
+----------------------------------------------------------------------
+
+Overview:
+---------
+Replaces fourier_transforms/time_complexity.py, which timed one DFT
+and one FFT call on a 20-point signal with time.time() and then opened
+a plot window. Single calls on tiny inputs measure mostly noise.
+
+This script benchmarks every subsystem (root finding, integration,
+ODEs, LU / Thomas / banded solvers, FFT, splines) without a display:
+
+✔ Sweeps each method over a range of problem sizes
+✔ Warms up, then repeats every timing and keeps the median and the
+  minimum, using the monotonic time.perf_counter() clock
+✔ Loops fast calls enough times that a single timing lasts at least
+  `min_time` seconds, so clock resolution doesn't matter
+✔ Fits an empirical scaling exponent p in  time ~ size^p  by least
+  squares on log(time) vs log(size) (p ~ 1 for O(n), ~ 3 for dense LU)
+✔ Reports the speedup of parallel solvers over their serial
+  counterpart at the same sizes (measured, on this machine's cores)
+✔ Writes all results to a JSON file
+✔ Compares against a saved baseline JSON and flags every size that got
+  slower than the baseline by more than `threshold` (exit code 1)
+
+How to Use:
+-----------
+    python benchmarks/run_benchmarks.py                       # all, writes benchmark_results.json
+    python benchmarks/run_benchmarks.py --only fft spline     # name filters
+    python benchmarks/run_benchmarks.py --quick               # first sizes only
+    python benchmarks/run_benchmarks.py --baseline old.json --threshold 0.25
+
+JSON layout:
+------------
+    {"meta": {...machine and library versions...},
+     "results": {"fft.FFT": {"sizes": [...], "median": [...],
+                             "min": [...], "number": [...],
+                             "exponent": 1.07}, ...},
+     "speedups": [{"name": ..., "size": ..., "speedup": 3.1}, ...]}
+
+Notes:
+------
+- Timings are per call (total loop time divided by the loop count).
+- Regression checks only compare sizes present in both files.
+- Modules are imported as packages (root_finding.secant_method, ...)
+  with the repository root on sys.path. Methods that print their
+  result have that output swallowed.
+
+======================================================================
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+os.environ.setdefault("MPLBACKEND","Agg")#never open a plot window
+import numpy as np
+
+ROOT=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0,ROOT)
+
+def _quiet(f,*args):
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return f(*args)
+    return run
+
+def _spline_data(n):
+    x=np.linspace(0.0,2.8,n)
+    return x,10+7*x-6*x**2+x**3
+
+def _diag_dominant(n,seed=0):
+    rng=np.random.default_rng(seed)
+    return rng.random((n,n))+n*np.eye(n),rng.random(n)
+
+def _tridiagonal(n,seed=0):
+    rng=np.random.default_rng(seed)
+    return rng.random(n-1),3+rng.random(n),rng.random(n-1),rng.random(n)
+
+#each benchmark: name -> (sizes, make(size) returning a zero-argument callable)
+def _benchmarks():
+    B={}
+
+    def root(module,func,call):
+        return lambda n: _quiet(getattr(importlib.import_module(module),func),*call(n))
+    B["root_finding.bisection"]=([5,10,20,40],root("root_finding.bisection_method","bisection_method",
+                                 lambda n:("x**(3)-2*(x)-5",2,3,n)))
+    B["root_finding.newton_raphson"]=([2,4,8,16],root("root_finding.newton_raphson_method","newtons_method",
+                                      lambda n:("x**(3)-2*(x)-5","3*(x)**2-2",2,n)))
+    B["root_finding.secant"]=([2,4,8,16],root("root_finding.secant_method","secant_method",
+                              lambda n:(3,2,n,"x**(3)-2*(x)-5")))
+
+    B["integration.trapezoid"]=([1000,4000,16000,64000],root("numerical_integration.trapezoid_rule","trapezoidal_rule",
+                                lambda n:(0,1,n,"4/(1+x**(2))")))
+    B["integration.simpson"]=([1000,4000,16000,64000],root("numerical_integration.simpsons_rule","simpsons_rule",
+                              lambda n:(0,1,n,"4/(1+x**(2))")))
+    B["ode.improved_euler"]=([25,50,100,200],root("differential_eqn_approx.improved_eulers_method","improved_eulers_method",
+                             lambda n:("Xo+Yo",0.0,1,n,0.01)))
+
+    def lu(n):
+        m=importlib.import_module("linear_algebra.LU_decomposition")
+        A,b=_diag_dominant(n)
+        return lambda: m.doolittle_LU_decomposition(n,A)
+    B["linear_algebra.doolittle_LU"]=([10,20,40,80],lu)
+
+    def lu_in_place(n):
+        m=importlib.import_module("linear_algebra.LU_decomposition")
+        A,b=_diag_dominant(n)
+        return lambda: m.doolittle_LU_in_place(n,A.copy())
+    B["linear_algebra.doolittle_LU_in_place"]=([100,200,400,800],lu_in_place)
+
+    def thomas(n):
+        m=importlib.import_module("linear_algebra.thomas_algorithm")
+        a,b,c,d=_tridiagonal(n)
+        return lambda: m.thomas_solve(a,b,c,d)
+    B["linear_algebra.thomas_solve"]=([1000,4000,16000,64000],thomas)
+
+    def batched_thomas(n):
+        m=importlib.import_module("linear_algebra.thomas_algorithm")
+        a,b,c,d=(np.tile(v,(1000,1)) for v in _tridiagonal(n))
+        return lambda: m.batched_thomas_solve(a,b,c,d)
+    B["linear_algebra.batched_thomas_solve_x1000"]=([16,64,256,1024],batched_thomas)
+
+    B["linear_algebra.thomas_solve_large"]=([250_000,1_000_000],thomas)
+
+    def parallel_thomas(n):
+        m=importlib.import_module("linear_algebra.parallel_tridiagonal")
+        a,b,c,d=_tridiagonal(n)
+        return lambda: m.parallel_thomas_solve(a,b,c,d,min_block=50_000)
+    B["linear_algebra.parallel_thomas_solve"]=([250_000,1_000_000],parallel_thomas)
+
+    def banded(n):
+        m=importlib.import_module("linear_algebra.banded_LU")
+        ab=np.vstack([np.full(n,1.0),np.full(n,-4.0),np.full(n,7.0),np.full(n,-4.0),np.full(n,1.0)])
+        rhs=np.ones(n)
+        return lambda: m.banded_LU_solve(m.banded_LU_decomposition(ab,2,2),2,2,rhs)
+    B["linear_algebra.banded_LU_pentadiagonal"]=([1000,4000,16000],banded)
+
+    def fft(n):
+        m=importlib.import_module("fourier_transforms.fast_fourier_transforms")
+        x=np.random.default_rng(0).standard_normal(n)
+        return lambda: m.FFT(x)
+    B["fft.FFT"]=([1024,4096,16384,65536,262144],fft)
+    B["fft.FFT_non_power_of_two"]=([1000,3000,10007,30000],fft)
+
+    def fft_batch(n):
+        m=importlib.import_module("fourier_transforms.fast_fourier_transforms")
+        x=np.random.default_rng(0).standard_normal((256,n))
+        return lambda: m.FFT(x,axis=-1)
+    B["fft.FFT_batch_256"]=([64,256,1024,4096],fft_batch)
+
+    def rfft(n):
+        m=importlib.import_module("fourier_transforms.real_fft")
+        x=np.random.default_rng(0).standard_normal(n)
+        return lambda: m.rfft(x)
+    B["fft.rfft"]=([1024,4096,16384,65536,262144],rfft)
+
+    def dft(n):
+        m=importlib.import_module("fourier_transforms.discrete_fourier_transforms")
+        x=list(np.random.default_rng(0).standard_normal(n))
+        return lambda: m.dft(x)
+    B["fft.dft_reference"]=([16,32,64,128],dft)
+
+    def cubic(n):
+        m=importlib.import_module("spline_interpolation.cubic_spline_with_thomas_alg")
+        x,y=_spline_data(n)
+        X=np.linspace(x[0],x[-1],1000)
+        return lambda: m.my_cubic_spline_flat(x,y,X)
+    B["spline.cubic_thomas_1000_queries"]=([16,64,256,1024],cubic)
+
+    def linear(n):
+        m=importlib.import_module("spline_interpolation.linear_splines")
+        x,y=_spline_data(n)
+        X=np.linspace(x[0],x[-1],1000)
+        return lambda: m.linear_interpolation(x,y,X)
+    B["spline.linear_1000_queries"]=([16,64,256,1024],linear)
+
+    def fitted_cubic(n):
+        m=importlib.import_module("spline_interpolation.splines")
+        x,y=_spline_data(n)
+        s=m.CubicSpline(x,y)
+        X=np.linspace(x[0],x[-1],100_000)
+        return lambda: s(X)
+    B["spline.CubicSpline_eval_1e5_queries"]=([16,256,4096,65536],fitted_cubic)
+
+    def batch_fit(curves):
+        m=importlib.import_module("spline_interpolation.batched_splines")
+        x=np.sort(np.random.default_rng(0).uniform(0,10,500))
+        Y=np.random.default_rng(1).standard_normal((curves,500))
+        return lambda: m.CubicSplineBatch(x,Y)
+    B["spline.CubicSplineBatch_fit_500_knots"]=([10,100,1000,10000],batch_fit)
+
+    def grid_cubic(n):
+        m=importlib.import_module("spline_interpolation.grid_splines")
+        x=np.linspace(0,1,n)
+        Z=np.random.default_rng(0).standard_normal((n,n))
+        s=m.CubicGridSpline(x,x,Z)
+        Q=np.random.default_rng(1).uniform(0,1,(2,100_000))
+        return lambda: s(*Q)
+    B["spline.CubicGridSpline_eval_1e5_queries"]=([16,64,256,1024],grid_cubic)
+
+    def mapped_linear(n):
+        m=importlib.import_module("spline_interpolation.mapped_tables")
+        x=np.cumsum(np.random.default_rng(0).uniform(0.5,1.5,n))
+        interp=m.MappedLinearInterpolator(x,np.sin(x))
+        X=np.sort(np.random.default_rng(1).uniform(x[n//4],x[n//4+50_000],100_000))
+        return lambda: interp(X)
+    B["spline.MappedLinear_1e5_sorted_queries"]=([10**5,10**6,10**7],mapped_linear)
+
+    def quadratic(n,exact=False,queries=1000):
+        m=importlib.import_module("spline_interpolation.quadratic_splines")
+        x,y=_spline_data(n)
+        X=np.linspace(x[0],x[-1],queries)
+        return lambda: m.quadratic_spline(x,y,X,exact=exact)
+    B["spline.quadratic_1000_queries"]=([16,64,256,1024],quadratic)
+    B["spline.quadratic_exact_200_queries"]=([4,8,16],lambda n: quadratic(n,True,200))
+
+    return B
+
+def time_call(f,repeats=5,min_time=0.002):
+    f()#warm-up: caches, plans, lazy imports
+    number=1
+    while True:#autorange like timeit
+        t0=time.perf_counter()
+        for _ in range(number):
+            f()
+        elapsed=time.perf_counter()-t0
+        if elapsed>=min_time or number>=1_000_000:
+            break
+        number*=2 if elapsed*10>=min_time else 10
+
+    samples=[elapsed/number]
+    for _ in range(repeats-1):
+        t0=time.perf_counter()
+        for _ in range(number):
+            f()
+        samples.append((time.perf_counter()-t0)/number)
+    return statistics.median(samples),min(samples),number
+
+def scaling_exponent(sizes,times):
+    if len(sizes)<2:
+        return None
+    slope,_=np.polyfit(np.log(sizes),np.log(times),1)
+    return float(slope)
+
+def run(names=None,quick=False,repeats=5,min_time=0.002,log=print):
+    results={}
+    for name,(sizes,make) in _benchmarks().items():
+        if names and not any(k in name for k in names):
+            continue
+        if quick:
+            sizes=sizes[:2]
+        entry={"sizes":[],"median":[],"min":[],"number":[]}
+        for n in sizes:
+            med,best,number=time_call(make(n),repeats,min_time)
+            entry["sizes"].append(n)
+            entry["median"].append(med)
+            entry["min"].append(best)
+            entry["number"].append(number)
+            log(f"{name:45s} n={n:<8d} median={med*1e3:10.4f} ms  min={best*1e3:10.4f} ms  (x{number})")
+        entry["exponent"]=scaling_exponent(entry["sizes"],entry["min"])
+        if entry["exponent"] is not None:
+            log(f"{name:45s} scaling exponent ~ {entry['exponent']:.2f}")
+        results[name]=entry
+    return results
+
+#benchmark -> serial benchmark on the same sizes it is a speedup over
+_SPEEDUPS={"linear_algebra.parallel_thomas_solve":"linear_algebra.thomas_solve_large"}
+
+def speedups(results):
+    #returns (name, size, serial/parallel) for every pair that was run
+    out=[]
+    for name,serial in _SPEEDUPS.items():
+        if name not in results or serial not in results:
+            continue
+        base=dict(zip(results[serial]["sizes"],results[serial]["median"]))
+        for n,t in zip(results[name]["sizes"],results[name]["median"]):
+            if n in base and t>0:
+                out.append((name,n,base[n]/t))
+    return out
+
+def metadata():
+    return {"python":platform.python_version(),
+            "numpy":np.__version__,
+            "platform":platform.platform(),
+            "processor":platform.processor(),
+            "cpu_count":os.cpu_count(),
+            "timestamp":time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+
+def compare(results,baseline,threshold=0.25):
+    #returns (name, size, ratio) for every size slower than baseline by more than threshold
+    regressions=[]
+    for name,entry in results.items():
+        old=baseline.get("results",{}).get(name)
+        if not old:
+            continue
+        old_times=dict(zip(old["sizes"],old["median"]))
+        for n,t in zip(entry["sizes"],entry["median"]):
+            if n in old_times and old_times[n]>0:
+                ratio=t/old_times[n]
+                if ratio>1+threshold:
+                    regressions.append((name,n,ratio))
+    return regressions
+
+def main(argv=None):
+    parser=argparse.ArgumentParser(description="Benchmark the numerical methods in this repository.")
+    parser.add_argument("--only",nargs="*",help="run benchmarks whose name contains any of these strings")
+    parser.add_argument("--quick",action="store_true",help="only the two smallest sizes of each benchmark")
+    parser.add_argument("--repeats",type=int,default=5)
+    parser.add_argument("--min-time",type=float,default=0.002,help="minimum seconds per timed loop")
+    parser.add_argument("--output",default="benchmark_results.json")
+    parser.add_argument("--baseline",help="JSON file from an earlier run to compare against")
+    parser.add_argument("--threshold",type=float,default=0.25,help="allowed slowdown before flagging, 0.25 = 25%%")
+    args=parser.parse_args(argv)
+
+    results=run(args.only,args.quick,args.repeats,args.min_time)
+    gains=speedups(results)
+    for name,n,ratio in gains:
+        print(f"SPEEDUP {name} n={n}: {ratio:.2f}x over serial on {os.cpu_count()} cores")
+    with open(args.output,"w") as f:
+        json.dump({"meta":metadata(),"results":results,
+                   "speedups":[{"name":k,"size":n,"speedup":r} for k,n,r in gains]},f,indent=2)
+    print(f"\nresults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline=json.load(f)
+        regressions=compare(results,baseline,args.threshold)
+        for name,n,ratio in regressions:
+            print(f"REGRESSION {name} n={n}: {ratio:.2f}x slower than baseline")
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%}")
+    return 0
+
+if __name__=="__main__":
+    sys.exit(main())
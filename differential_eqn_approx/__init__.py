@@ -0,0 +1,28 @@
+"""
+Differential Equation Approximation
+-----------------------------------
+
+Improved Euler (Heun) method for dy/dx = f(x, y).
+
+improved_eulers_method shares the name of its module, so it is bound
+when the package is imported: a lazy binding would be replaced by the
+submodule as soon as anything ran
+`import differential_eqn_approx.improved_eulers_method`.
+"""
+
+import importlib
+from differential_eqn_approx.improved_eulers_method import improved_eulers_method
+
+_exports={}
+
+__all__=sorted(["improved_eulers_method",*_exports])
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value=getattr(importlib.import_module(f"{__name__}.{_exports[name]}"),name)
+    globals()[name]=value#later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals())|set(__all__))
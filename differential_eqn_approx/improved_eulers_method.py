@@ -1,4 +1,3 @@
-import pandas as pd
 def improved_eulers_method(func,Xo,Yo,n,h):
     """
      Improved Euler's Method (Heun's Method) — Step-by-step Table Generator
@@ -33,6 +32,7 @@ def improved_eulers_method(func,Xo,Yo,n,h):
 
     
     
+    import pandas as pd#only needed to format the table
     def f(Xo,Yo):
         f=eval(func)
         return f 
@@ -47,6 +47,7 @@ def improved_eulers_method(func,Xo,Yo,n,h):
     
  
 #example case
-table=improved_eulers_method("Xo+Yo",0.0,1,20,0.1)
-print(table)  
+if __name__=="__main__":
+    table=improved_eulers_method("Xo+Yo",0.0,1,20,0.1)
+    print(table)  
         
\ No newline at end of file
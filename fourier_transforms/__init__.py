@@ -0,0 +1,50 @@
+"""
+Fourier Transforms
+------------------
+
+DFT, FFT plans, real and 2-D transforms, convolution and STFT.
+
+Every name below is imported from its module the first time it is
+used, so `import fourier_transforms` itself loads nothing.
+"""
+
+import importlib
+
+_exports={
+    "dft":"discrete_fourier_transforms",
+    "dft_matrix":"discrete_fourier_transforms",
+    "matrix_dft":"discrete_fourier_transforms",
+    "FFT":"fast_fourier_transforms",
+    "IFFT":"fast_fourier_transforms",
+    "FFTPlan":"fast_fourier_transforms",
+    "get_plan":"fast_fourier_transforms",
+    "FORWARD":"fast_fourier_transforms",
+    "BACKWARD":"fast_fourier_transforms",
+    "set_dft_crossover":"fast_fourier_transforms",
+    "find_dft_crossover":"fast_fourier_transforms",
+    "rfft":"real_fft",
+    "irfft":"real_fft",
+    "convolve":"fft_convolution",
+    "correlate":"fft_convolution",
+    "next_fast_len":"fft_convolution",
+    "OverlapAddFilter":"fft_convolution",
+    "overlap_add":"fft_convolution",
+    "get_window":"stft",
+    "iter_stft":"stft",
+    "spectrogram_to_file":"stft",
+    "FFT2":"fft_2d",
+    "IFFT2":"fft_2d",
+    "transpose_in_place":"fft_2d",
+}
+
+__all__=sorted(_exports)
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value=getattr(importlib.import_module(f"{__name__}.{_exports[name]}"),name)
+    globals()[name]=value#later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals())|set(__all__))
@@ -15,6 +15,7 @@ of a sampled signal using the DFT formula, and visualizes:
 Modules Used:
 -------------
 - cmath: For complex exponential calculations
+- numpy: For the cached DFT matrix fast path
 - matplotlib.pyplot: For plotting graph
 
 What it does:
@@ -24,9 +25,23 @@ What it does:
 - Plots the original sampled signal over time
 - Plots the DFT magnitude spectrum for frequencies
 
+Small-N fast path:
+------------------
+For the tiny transform sizes used in hot inner loops the whole DFT
+is one matrix product X = F x with
+
+    F[k, n] = exp(-2*pi*i*k*n/N)
+
+dft_matrix(N) builds F once per size (k*n is reduced mod N first so
+the phases stay exact) and keeps it in a bounded LRU cache of 32
+matrices. matrix_dft(x, axis) then transforms every signal along
+`axis` at once, so a batch of signals becomes a single matrix-matrix
+product. FFT() in fast_fourier_transforms.py switches to this path
+automatically below a measured crossover size.
+
 Notes:
 ------
-- This is a basic educational implementation of DFT (O(N²) time)
+- dft() is a basic educational implementation of DFT (O(N²) time)
 - For performance with large signals, consider using FFT
 - The sampling rate is assumed to be 20 Hz
 
@@ -38,7 +53,8 @@ Notes:
 
 
 import cmath
-import matplotlib.pyplot as plt
+import functools
+import numpy as np
 
 def dft(x):
     N=len(x)
@@ -50,6 +66,24 @@ def dft(x):
        X.append(sum)
        sum=0
     return X
+
+@functools.lru_cache(maxsize=32)
+def _cached_dft_matrix(N,direction,dtype):
+    k=np.arange(N)
+    F=np.exp(direction*2j*np.pi*(np.outer(k,k)%N)/N).astype(dtype)
+    F.setflags(write=False)#shared by every caller
+    return F
+
+def dft_matrix(N,direction=-1,dtype=np.complex128):
+    return _cached_dft_matrix(int(N),direction,np.dtype(dtype))
+
+def matrix_dft(x,axis=-1):
+    x=np.asarray(x)
+    dtype=np.complex64 if x.dtype in (np.float32,np.complex64) else np.complex128
+    F=dft_matrix(x.shape[axis],dtype=dtype)
+    #F is symmetric, so x @ F applies it to every signal in the batch
+    X=np.moveaxis(x,axis,-1)@F
+    return np.moveaxis(X,-1,axis)
     
 def run_dft():
     x = [ 0.00000000e+00, 
@@ -67,6 +101,7 @@ def run_dft():
     return x,X
 
 def plot(x,X):
+    import matplotlib.pyplot as plt
     N=len(x)
     
     sampling_time=[0., 0.05, 0.1 , 0.15, 0.2 , 0.25, 0.3 , 0.35, 
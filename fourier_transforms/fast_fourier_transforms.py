@@ -8,45 +8,139 @@ Overview:
 ---------
 This script performs a Fast Fourier Transform (FFT) on a 
 discrete time-domain signal to analyze its frequency content.
-It uses a recursive implementation of the Cooley-Tukey FFT 
-algorithm, which significantly improves performance compared 
-to the standard DFT.
+It uses an iterative, in-place implementation of the radix-2
+Cooley-Tukey FFT algorithm, which significantly improves
+performance compared to the standard DFT.
+
+How the iterative FFT works:
+----------------------------
+1. Copy the input into a NumPy complex buffer in bit-reversed order
+   (index 0b0011 goes to 0b1100, ...). After this reordering every
+   pair of sub-transforms that must be combined sits side by side.
+2. Run log2(N) butterfly stages on that buffer. Stage m combines
+   blocks of length m into blocks of length 2m:
+       t        = W^k * X[odd]
+       X[odd]   = X[even] - t
+       X[even]  = X[even] + t
+   Each stage is a few vectorized NumPy operations over the whole
+   buffer instead of a Python loop per butterfly.
+3. The twiddle factors W^k = exp(-2*pi*i*k/N) and the bit-reversal
+   permutation are computed once per size N and kept in a plan (see
+   below), so repeated transforms of the same length call no exp()
+   at all.
+
+Plans:
+------
+An FFTPlan is built once for a given (N, dtype, direction) and holds
+everything that only depends on those three: the bit-reversal
+permutation, the twiddle tables, the sub-plans used by the mixed-radix
+and Bluestein paths. plan.execute(x, out) can then be called for
+millions of frames without recomputing any of it.
+
+Scratch (the input copy, the butterfly temporary, the mixed-radix and
+Bluestein work arrays) depends on the batch size as well, and there
+are two kinds of plan:
+
+- Shared plans, from get_plan(N, dtype, direction): a module-level LRU
+  cache (PLAN_CACHE_SIZE = 64 entries), so code that keeps
+  transforming the same sizes only builds each plan once. FFT() goes
+  through get_plan. These plans are stateless: scratch is allocated
+  per call and freed when it returns, so a cached plan never pins
+  memory from a large batch and can be used from several threads.
+- Owned plans, FFTPlan(N, dtype, direction, batch=b): built by the
+  caller, they also hold scratch for up to b signals (the whole
+  sub-plan tree's, sub-plans themselves still come from the cache).
+  plan.execute(x, out=out) with at most b signals then allocates no
+  arrays (only NumPy's own fixed-size ufunc buffers for strided
+  operands remain). Larger batches still work, with per-call scratch.
+  An owned plan is for one thread at a time.
+
+    direction = -1 (FORWARD)  : X[k] = sum x[n] exp(-2*pi*i*k*n/N)
+    direction = +1 (BACKWARD) : same with +i and no 1/N scaling
+
+Small sizes:
+------------
+For N up to DFT_CROSSOVER (256) the transform is one product with a
+cached N x N DFT matrix (dft_matrix in discrete_fourier_transforms.py);
+for a batch of signals that is one matrix-matrix product, which beats
+the butterfly stages at these sizes. find_dft_crossover() re-measures
+the crossover on the current machine and set_dft_crossover() applies
+a new value.
+
+Other lengths (any N):
+----------------------
+- Mixed radix: when N = p * m with a small prime p (2, 3, 5, 7) the
+  signal is split into p interleaved sub-signals x[s::p] of length m.
+  All p sub-FFTs are done in one batched call, multiplied by the
+  twiddles W_N^(s*k) and combined with a small p x p DFT:
+      X[k + m*q] = sum_s W_p^(s*q) * W_N^(s*k) * FFT_m(x[s::p])[k]
+  This recurses until the remaining length is a power of two.
+- Bluestein (chirp-z): when N has a large prime factor, the DFT is
+  rewritten with n*k = (n² + k² - (k-n)²)/2 as a convolution with
+  the chirp exp(i*pi*n²/N). The convolution is done with radix-2
+  FFTs of length M >= 2N-1, so even prime N costs O(N log N).
 
 What it does:
 -------------
 - Defines a sample signal of 20 evenly sampled values
-- Applies FFT recursively (divide and conquer strategy)
+- Applies the FFT iteratively (bit-reversal + butterfly stages)
 - Extracts and plots the frequency magnitude spectrum
 - Displays the result visually using matplotlib
 
 Functions():
 ----------------
-1. FFT(x):
-    A recursive function that computes the FFT of a list `x`.
+1. FFT(x, axis=-1, out=None):
+    Computes the FFT of a list or array `x` and returns a NumPy
+    complex array (complex64 for float32/complex64 input).
+    x may have any number of dimensions: every 1-D signal along
+    `axis` is transformed, and all of them go through each butterfly
+    stage together in one vectorized operation (many channels or
+    frames cost about as much Python work as one). `out` is an
+    optional preallocated complex array of the same shape as x; its
+    dtype (complex64 or complex128) picks the precision, and any other
+    dtype or shape raises ValueError.
+
+2. IFFT(X, axis=-1, out=None):
+    Inverse transform, IFFT(FFT(x)) == x. Same batching and `out`
+    handling as FFT.
 
-2. run_fft():
+3. FFTPlan(N, dtype, direction, batch=None) / get_plan(N, dtype, direction):
+    Precomputed transform of one size; plan.execute(x, axis, out)
+    works like FFT but x.shape[axis] must equal N. batch=b makes the
+    plan own reusable scratch for up to b signals (see Plans).
+
+4. find_dft_crossover(max_n, batch, repeats) / set_dft_crossover(n):
+    Benchmark that finds the largest size where the DFT-matrix path is
+    still faster than the FFT, and the setter that changes it.
+
+5. run_fft():
     Prepares a predefined signal and applies the FFT.
 
-3. plot(x, X):
+6. plot(x, X):
     Visualizes the frequency spectrum of the FFT result 
     (only half-spectrum shown since it’s symmetric for real signals).
 
-4.`main():
+7.`main():
     Entry point that calls the FFT and plotting routines.
 
 How to Use:
 -----------
-Just run the script using Python:
+Run the module from the repository root (it imports its siblings as
+fourier_transforms.*, so running the file by path does not work):
 
-    python fft_visualizer.py
+    python -m fourier_transforms.fast_fourier_transforms
 
 You’ll see a stem plot showing the magnitudes of the frequency 
 components of the input signal.
 
 Notes:
 ------
-- This implementation is for **educational purposes** and works 
-  best with signals of length N = 2^k (power of two).
+- Any length N works in O(N log N); powers of two take the fastest
+  path, smooth sizes (only factors 2, 3, 5, 7) the mixed-radix path
+  and everything else goes through Bluestein.
+- Shared plans are read-only after construction, so one plan (and
+  FFT() through the shared cache) can be used from several threads.
+  A plan built with batch= writes its scratch on every call.
 - The current signal has a sampling rate of 20 Hz and 20 points.
 - The frequency spectrum is scaled by N to normalize the output.
 
@@ -54,26 +148,254 @@ Notes:
 """
 
 
-import cmath
+import functools
 import time
-import matplotlib.pyplot as plt 
+import numpy as np
+from fourier_transforms.discrete_fourier_transforms import dft_matrix
 
-def FFT(x):
-    N=len(x)
-    X=[0]*N
-    
-    if N>1:
-      even=FFT(x[0::2])
-      odd=FFT(x[1::2])
+_MAX_RADIX=7#larger prime factors go through Bluestein
+DFT_CROSSOVER=256#sizes up to this use one cached DFT matrix product,
+                 #measured with find_dft_crossover(batch=64)
+FORWARD=-1
+BACKWARD=1
+PLAN_CACHE_SIZE=64#entries in every per-size transform cache
+
+def _smallest_prime_factor(N):
+    p=2
+    while p*p<=N:
+        if N%p==0:
+            return p
+        p+=1
+    return N
+
+class FFTPlan:
+    def __init__(self,N,dtype=np.complex128,direction=FORWARD,batch=None):
+        if direction not in (FORWARD,BACKWARD):
+            raise ValueError("direction must be -1 (forward) or +1 (backward)")
+        self.N=int(N)
+        self.dtype=np.dtype(dtype)
+        self.direction=direction
+        sign=2j*np.pi*direction
+        N=self.N
+
+        if N<=1:
+            self.kind="trivial"
+        elif N<=DFT_CROSSOVER:
+            self.kind="matrix"
+            self.F=dft_matrix(N,direction,self.dtype)
+        elif N&(N-1)==0:
+            self.kind="radix2"
+            bits=N.bit_length()-1
+            n=np.arange(N)
+            self.rev=np.zeros(N,dtype=np.intp)
+            for b in range(bits):
+                self.rev|=((n>>b)&1)<<(bits-1-b)
+            self.W=np.exp(sign*np.arange(N//2)/N).astype(self.dtype)
+        else:
+            p=_smallest_prime_factor(N)
+            if p>_MAX_RADIX:
+                self.kind="bluestein"
+                M=1<<(2*N-2).bit_length()
+                n=np.arange(N)
+                chirp=np.exp(sign*((n*n)%(2*N))/(2*N))#n² mod 2N keeps the phase exact
+                b=np.zeros((1,M),dtype=self.dtype)
+                b[0,:N]=np.conj(chirp)
+                b[0,M-N+1:]=np.conj(chirp[:0:-1])
+                self.M=M
+                self.chirp=chirp.astype(self.dtype)
+                self.inner=get_plan(M,self.dtype,FORWARD)
+                self.inner_inv=get_plan(M,self.dtype,BACKWARD)
+                #FFT of the conjugate chirp, with the 1/M of the inverse folded in
+                self.B=self.inner.execute(b)[0]/M
+            else:
+                self.kind="matrix" if p==N else "mixed"
+                m=N//p
+                self.p=p
+                self.F=dft_matrix(p,direction,self.dtype)
+                self.T=np.exp(sign*np.outer(np.arange(p),np.arange(m))/N).astype(self.dtype)
+                if m>1:
+                    self.sub=get_plan(m,self.dtype,direction)
+
+        #owned scratch (batch=None for shared plans, which stay stateless)
+        self.batch=None if batch is None else int(batch)
+        if self.batch is not None:
+            self._src=np.empty((self.batch,N),dtype=self.dtype)
+            self._dst=None#only for outputs that are not contiguous, made on first use
+            self._work=self._workspace(self.batch)
+
+    def __repr__(self):
+        name="forward" if self.direction==FORWARD else "backward"
+        owned="" if self.batch is None else f", batch={self.batch}"
+        return f"FFTPlan(N={self.N}, dtype={self.dtype.name}, {name}, {self.kind}{owned})"
+
+    def _workspace(self,batch):
+        #scratch of _execute for up to `batch` signals, one dict per level of sub-plans
+        if self.kind=="radix2":
+            return {"t":np.empty((batch,self.N//2),dtype=self.dtype)}
+        if self.kind=="mixed":
+            return {"sub":np.empty((batch,self.p,self.N//self.p),dtype=self.dtype),
+                    "child":self.sub._workspace(batch*self.p)}
+        if self.kind=="bluestein":
+            #inner and inner_inv run one after the other, so they share one child
+            return {"a":np.empty((batch,self.M),dtype=self.dtype),
+                    "A":np.empty((batch,self.M),dtype=self.dtype),
+                    "child":self.inner._workspace(batch)}
+        return {}
+
+    def _execute(self,src,dst,work=None):
+        #src, dst: C-contiguous (batch, N) arrays, src may be overwritten
+        #work: a _workspace for at least batch signals, None allocates one
+        batch,N=src.shape
+        if work is None:
+            work=self._workspace(batch)
+        if self.kind=="trivial":
+            dst[:]=src
+
+        elif self.kind=="radix2":
+            np.take(src,self.rev,axis=1,out=dst,mode='clip')#'clip' skips the bounds-check copy
+            t=work["t"][:batch]#scratch for W^k * odd
+            m=1
+            while m<N:
+                blocks=dst.reshape(batch,N//(2*m),2,m)
+                even=blocks[:,:,0,:]
+                odd=blocks[:,:,1,:]
+                tw=t.reshape(batch,N//(2*m),m)
+                np.multiply(odd,self.W[::N//(2*m)],out=tw)
+                np.subtract(even,tw,out=odd)
+                np.add(even,tw,out=even)
+                m*=2
+
+        elif self.kind=="matrix":
+            np.matmul(src,self.F,out=dst)#F is symmetric
+
+        elif self.kind=="mixed":
+            p=self.p
+            m=N//p
+            #row s of the sub-problem is the interleaved signal x[s::p]
+            sub=work["sub"][:batch]
+            sub[:]=src.reshape(batch,m,p).transpose(0,2,1)
+            Y=src.reshape(batch,p,m)
+            self.sub._execute(sub.reshape(batch*p,m),Y.reshape(batch*p,m),work["child"])
+            Y*=self.T
+            np.matmul(self.F,Y,out=dst.reshape(batch,p,m))
+
+        else:#bluestein
+            a=work["a"][:batch]
+            A=work["A"][:batch]
+            np.multiply(src,self.chirp,out=a[:,:N])
+            a[:,N:]=0
+            self.inner._execute(a,A,work["child"])
+            A*=self.B
+            self.inner_inv._execute(A,a,work["child"])
+            np.multiply(a[:,:N],self.chirp,out=dst)
+
+        return dst
+
+    def execute(self,x,axis=-1,out=None):
+        x=np.asarray(x)
+        axis=axis%x.ndim
+        if x.shape[axis]!=self.N:
+            raise ValueError(f"plan is for length {self.N}, got {x.shape[axis]} along axis {axis}")
+        moved=np.moveaxis(x,axis,-1)#view with the transform axis last
+        batch=moved.size//max(self.N,1)
+        owned=self.batch is not None and batch<=self.batch
+        work=self._work if owned else None
+
+        if out is None:
+            out=np.empty(x.shape,dtype=self.dtype)
+        elif out.shape!=x.shape or out.dtype!=self.dtype:
+            raise ValueError(f"out must be a {self.dtype.name} array of shape {x.shape}")
+        out_moved=np.moveaxis(out,axis,-1)
+
+        if (self.kind!="mixed" and moved.dtype==self.dtype and moved.flags.c_contiguous
+                and not np.may_share_memory(moved,out)):
+            src=moved.reshape(batch,self.N)#only the mixed path writes to src
+        else:
+            src=self._src[:batch] if owned else np.empty((batch,self.N),dtype=self.dtype)
+            src.reshape(moved.shape)[...]=moved
+
+        if out_moved.flags.c_contiguous:
+            self._execute(src,out_moved.reshape(batch,self.N),work)
+        else:
+            if not owned:
+                dst=np.empty((batch,self.N),dtype=self.dtype)
+            else:
+                if self._dst is None:
+                    self._dst=np.empty((self.batch,self.N),dtype=self.dtype)
+                dst=self._dst[:batch]
+            self._execute(src,dst,work)
+            out_moved[...]=dst.reshape(moved.shape)
+        return out
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _cached_plan(N,dtype,direction):
+    return FFTPlan(N,dtype,direction)
+
+def get_plan(N,dtype=np.complex128,direction=FORWARD):
+    return _cached_plan(int(N),np.dtype(dtype),direction)
+
+def _transform_dtype(x,out):
+    #dtype of the plan; checked before get_plan so a bad out never builds one
+    if out is None:
+        return np.complex64 if x.dtype in (np.float32,np.complex64) else np.complex128
+    if not isinstance(out,np.ndarray) or out.dtype.kind!="c":
+        raise ValueError("out must be a complex NumPy array")
+    if out.shape!=x.shape:
+        raise ValueError(f"out must have the shape of the input {x.shape}, got {out.shape}")
+    return out.dtype
+
+def FFT(x,axis=-1,out=None):
+    x=np.asarray(x)
+    dtype=_transform_dtype(x,out)
+    return get_plan(x.shape[axis],dtype).execute(x,axis,out)
+
+def IFFT(X,axis=-1,out=None):
+    X=np.asarray(X)
+    dtype=_transform_dtype(X,out)
+    N=X.shape[axis]
+    out=get_plan(N,dtype,BACKWARD).execute(X,axis,out)
+    out/=max(N,1)
+    return out
 
-      for k in range(N//2):
-          X[k]=even[k]+cmath.exp((-1j *2  *cmath.pi * k )/N)*odd[k]
-          X[k+N//2]=even[k]-cmath.exp((-1j *2  *cmath.pi * k)/N)*odd[k]
+def set_dft_crossover(n):
+    global DFT_CROSSOVER
+    DFT_CROSSOVER=int(n)
+    _cached_plan.cache_clear()#plans built with the old crossover
 
-      return X
+def find_dft_crossover(max_n=4096,batch=64,repeats=7):
+    #times one batched DFT-matrix product against the FFT plan on
+    #powers of two (the FFT's best case) and returns the largest size
+    #where the matrix product is still faster
+    global DFT_CROSSOVER
+    saved=DFT_CROSSOVER
+    rng=np.random.default_rng(0)
+    crossover=1
+    try:
+        DFT_CROSSOVER=0
+        N=2
+        while N<=max_n:
+            x=rng.standard_normal((batch,N))+0j
+            out=np.empty_like(x)
+            F=dft_matrix(N)
+            plan=FFTPlan(N)
+            times=[]
+            for run in (lambda: np.matmul(x,F,out=out),lambda: plan.execute(x,out=out)):
+                run()#warm-up
+                best=float("inf")
+                for _ in range(repeats):
+                    t0=time.perf_counter()
+                    run()
+                    best=min(best,time.perf_counter()-t0)
+                times.append(best)
+            if times[1]<times[0]:
+                break
+            crossover=N
+            N*=2
+    finally:
+        DFT_CROSSOVER=saved
+        _cached_plan.cache_clear()#sub-plans were built without the matrix path
+    return crossover
 
-    else:
-        return x  
 def run_fft():
     x = [ 0.00000000e+00, 
        5.57590997e+00, 2.04087031e+00, 
@@ -92,6 +414,7 @@ def run_fft():
     return x,X
  
 def plot(x,X):
+    import matplotlib.pyplot as plt
     N=len(x)
     sampling_time=[0., 0.05, 0.1 , 0.15, 0.2 , 0.25, 0.3 , 0.35, 
        0.4 , 0.45, 0.5 ,
@@ -102,7 +425,7 @@ def plot(x,X):
       
     #plot the FFT magnitude spectrum
     f_k=[ k*sampling_rate/len(X)  for k in range(len(X))]  
-    X_k=[abs(val)/N for val in X]
+    X_k=(np.abs(X)/N).tolist()
     plt.stem(f_k[:N//2], X_k[:N//2], basefmt=" ", label="FFT Magnitude(s)")
     plt.legend()
     plt.grid()
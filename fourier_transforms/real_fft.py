@@ -0,0 +1,154 @@
+"""
+============================================================
+Real-Input FFT (rfft / irfft)
+------------------------------------------------------------
+
+
+Overview:
+---------
+Every signal we transform is real, but FFT() and dft() compute the
+full complex spectrum of length N. For real x the spectrum is
+conjugate symmetric, X[N-k] = conj(X[k]), so only the first N//2+1
+bins carry information (plot() already throws the rest away).
+
+rfft() exploits that twice:
+1. It only returns the N//2+1 non-redundant bins.
+2. It only runs an FFT of length N/2: the even and odd samples are
+   packed into one complex signal z[n] = x[2n] + i*x[2n+1] and the
+   two half-length spectra are separated afterwards:
+       E[k] = (Z[k] + conj(Z[N/2-k])) / 2
+       O[k] = (Z[k] - conj(Z[N/2-k])) / (2i)
+       X[k] = E[k] + W_N^k * O[k]          k = 0..N/2
+So a real transform costs about half the work and half the memory
+of a complex one.
+
+irfft() is the matching inverse: it rebuilds Z from the half
+spectrum with the same weights,
+       Z[k] = conj(A[k])*X[k] + conj(B[k])*conj(X[N/2-k])      k = 0..N/2-1
+runs one inverse FFT of length N/2 and reads the even and odd samples
+straight out of the real and imaginary parts (a float view of Z).
+Like rfft it transforms every signal along `axis` in one batched call.
+
+Functions():
+----------------
+1. rfft(x, axis=-1):
+    Returns the N//2+1 complex bins of the real signal x. For an N-D
+    x every signal along `axis` is transformed, all in one batched
+    half-length FFT.
+
+2. irfft(X, n=None, axis=-1):
+    Returns the real signal of length n (default 2*(m-1) for m bins
+    along `axis`) whose rfft is X; irfft(rfft(x, axis), N, axis) == x
+    for any N-D x. Bins beyond n//2+1 are ignored, missing ones are
+    taken as zero.
+
+3. run_rfft():
+    Applies rfft to the same 20-sample signal used in
+    fast_fourier_transforms.py and checks the round trip, also for a
+    batch of signals along either axis of a 2-D array.
+
+Notes:
+------
+- Odd N cannot be split into even/odd halves; rfft then takes the
+  full complex FFT and keeps the first N//2+1 bins.
+- The half-length FFT goes through FFT() from fast_fourier_transforms,
+  so any N works.
+- The unpacking twiddles W_N^k (and the weights A, B built from
+  them, X = A*Z[k] + B*conj(Z[N/2-k])) are cached per N in an LRU cache with
+  the same bound as the FFT plans (PLAN_CACHE_SIZE).
+
+============================================================
+"""
+
+
+import functools
+import numpy as np
+from fourier_transforms.fast_fourier_transforms import FFT,get_plan,BACKWARD,PLAN_CACHE_SIZE
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _packing(N):
+    #W_N^k for k = 0..N/2 and the unpacking weights A = (1 - iW)/2,
+    #B = (1 + iW)/2, bounded like the FFT plan cache
+    W=np.exp(-2j*np.pi*np.arange(N//2+1)/N)
+    A=(1-1j*W)/2
+    B=(1+1j*W)/2
+    for t in (W,A,B):
+        t.setflags(write=False)#shared by every caller
+    return W,A,B
+
+def rfft(x,axis=-1):
+    x=np.moveaxis(np.asarray(x,dtype=float),axis,-1)
+    N=x.shape[-1]
+    if N%2:
+        X=FFT(x)[...,:N//2+1]
+    else:
+        #adjacent (even, odd) float pairs already are z = x[2n] + i*x[2n+1]
+        z=np.ascontiguousarray(x).view(np.complex128)
+        Z=FFT(z)#all signals in one batched call
+        _,A,B=_packing(N)
+        Zk=np.concatenate([Z,Z[...,:1]],axis=-1)#Z[k] for k = 0..h (Z is h-periodic)
+        #X = E + W*O = A*Z[k] + B*conj(Z[h-k])
+        X=np.multiply(Zk,A)
+        Zc=np.conj(Zk[...,::-1])
+        Zc*=B
+        X+=Zc
+    return np.moveaxis(X,-1,axis)
+
+def irfft(X,n=None,axis=-1):
+    X=np.moveaxis(np.asarray(X,dtype=complex),axis,-1)
+    if n is None:
+        n=2*(X.shape[-1]-1)
+    if n<1:
+        raise ValueError(f"output length must be at least 1, got {n}")
+    m=n//2+1
+    if X.shape[-1]<m:
+        pad=np.zeros(X.shape[:-1]+(m-X.shape[-1],),dtype=complex)
+        X=np.concatenate([X,pad],axis=-1)
+    X=X[...,:m]
+
+    if n%2:
+        #rebuild the full symmetric spectrum and take one inverse FFT
+        full=np.concatenate([X,np.conj(X[...,:0:-1])],axis=-1)
+        x=np.real(get_plan(n,direction=BACKWARD).execute(full))/n
+    else:
+        h=n//2
+        _,A,B=_packing(n)
+        #Z[k] = conj(A)*X[k] + conj(B)*conj(X[h-k]), k = 0..h-1
+        Z=np.multiply(X[...,:h],np.conj(A[:h]))
+        Zc=np.conj(X[...,h:0:-1])
+        Zc*=np.conj(B[:h])
+        Z+=Zc
+        #X[0] and X[h] of a real signal are real, their imaginary parts are ignored
+        re0,reh=X[...,0].real,X[...,h].real
+        Z[...,0]=(re0+reh)/2+0.5j*(re0-reh)
+        z=get_plan(h,direction=BACKWARD).execute(Z)
+        z/=h
+        x=z.view(np.float64)#x[2n] = Re z[n], x[2n+1] = Im z[n]
+    return np.moveaxis(x,-1,axis)
+
+def run_rfft():
+    x = [ 0.00000000e+00,
+       5.57590997e+00, 2.04087031e+00,
+       -8.37717508e+00, -5.02028540e-01,
+       1.00000000e+01, -5.20431056e+00,
+       -7.68722952e-01, -5.56758182e+00,
+       1.02781920e+01,
+       1.71450552e-15, -1.02781920e+01,
+       5.56758182e+00, 7.68722952e-01,
+       5.20431056e+00, -1.00000000e+01,
+       5.02028540e-01, 8.37717508e+00,
+       -2.04087031e+00, -5.57590997e+00]
+    X=rfft(x)
+    print(f"{len(X)} bins for {len(x)} samples")
+    print(f"Magnitudes: {np.abs(X)/len(x)}")
+    print(f"round trip error: {np.max(np.abs(irfft(X,len(x))-x)):.3e}")
+
+    x2=np.random.default_rng(0).standard_normal((8,len(x)))
+    for axis in (-1,0):
+        xa=x2 if axis==-1 else x2.T
+        err=np.max(np.abs(irfft(rfft(xa,axis),xa.shape[axis],axis)-xa))
+        print(f"2-D round trip error (axis={axis}): {err:.3e}")
+    return x,X
+
+if __name__=="__main__":
+    run_rfft()
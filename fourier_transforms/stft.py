@@ -0,0 +1,147 @@
+"""
+============================================================
+Streaming Short-Time Fourier Transform (STFT) Spectrogram
+------------------------------------------------------------
+
+
+Overview:
+---------
+discrete_fourier_transforms.py and fast_fourier_transforms.py
+transform one short array that sits in memory. Recordings are often
+gigabytes long, so this script computes a spectrogram frame by frame:
+
+1. The raw samples are opened with numpy.memmap, so nothing is read
+   until a frame needs it.
+2. Frames of `frame_length` samples, `hop` samples apart, are cut
+   out as strided views (no copies), multiplied by a window and
+   zero-padded to `n_fft`.
+3. `batch_frames` frames at a time go through one batched real-input
+   transform (rfft from real_fft.py): the frames are real, so only
+   the N//2+1 non-negative frequency bins are computed, with one
+   half-length complex FFT per frame, about half the work of a full
+   complex FFT.
+4. The magnitude or power of those bins is written straight into a
+   .npy file opened with open_memmap, one batch at a time.
+
+Memory use depends only on batch_frames and n_fft, never on the
+length of the recording.
+
+Spectrogram layout:
+-------------------
+    S[t, k]   t = frame index   (time = t*hop/sampling_rate)
+              k = frequency bin (frequency = k*sampling_rate/n_fft)
+
+Functions():
+----------------
+1. get_window(name, n):
+    "hann", "hamming" or "rectangular" window of length n.
+
+2. iter_stft(x, frame_length, hop, n_fft, window, batch_frames):
+    Generator over (first_frame_index, complex spectra) batches of any
+    1-D array, including a memmap. Each spectrum holds the n_fft//2+1
+    non-negative frequency bins.
+
+3. spectrogram_to_file(input_path, output_path, ...):
+    Reads raw samples from input_path and writes a (frames, bins)
+    magnitude or power spectrogram to output_path as a .npy file.
+
+4. run_stft():
+    Writes a synthetic chirp to a temporary file and computes its
+    spectrogram on disk.
+
+Notes:
+------
+- Frames that would run past the end of the signal are dropped.
+- The window is periodic (DFT-even), the usual choice for spectral
+  analysis.
+
+============================================================
+"""
+
+
+import os
+import tempfile
+import numpy as np
+from fourier_transforms.real_fft import rfft
+
+def get_window(name,n):
+    k=np.arange(n)
+    if name=="hann":
+        return 0.5-0.5*np.cos(2*np.pi*k/n)
+    if name=="hamming":
+        return 0.54-0.46*np.cos(2*np.pi*k/n)
+    if name=="rectangular":
+        return np.ones(n)
+    raise ValueError("window must be 'hann', 'hamming' or 'rectangular'")
+
+def _frame_count(n_samples,frame_length,hop):
+    if n_samples<frame_length:
+        return 0
+    return 1+(n_samples-frame_length)//hop
+
+def iter_stft(x,frame_length=1024,hop=256,n_fft=None,window="hann",batch_frames=256):
+    n_fft=n_fft or frame_length
+    if n_fft<frame_length:
+        raise ValueError("n_fft must be at least frame_length")
+    if hop<=0:
+        raise ValueError("hop must be positive")
+    w=get_window(window,frame_length) if isinstance(window,str) else np.asarray(window,dtype=float)
+    if len(w)!=frame_length:
+        raise ValueError("window length must equal frame_length")
+
+    n_frames=_frame_count(len(x),frame_length,hop)
+    buf=np.zeros((batch_frames,n_fft))#zero tail = padding to n_fft
+
+    for t0 in range(0,n_frames,batch_frames):
+        t1=min(n_frames,t0+batch_frames)
+        b=t1-t0
+        #only this slice of the memmap is read from disk
+        segment=np.asarray(x[t0*hop:(t1-1)*hop+frame_length],dtype=float)
+        frames=np.lib.stride_tricks.sliding_window_view(segment,frame_length)[::hop]
+        np.multiply(frames,w,out=buf[:b,:frame_length])
+        yield t0,rfft(buf[:b],axis=-1)
+
+def spectrogram_to_file(input_path,output_path,dtype=np.float32,frame_length=1024,hop=256,
+                        n_fft=None,window="hann",scale="power",batch_frames=256):
+    if scale not in ("power","magnitude"):
+        raise ValueError("scale must be 'power' or 'magnitude'")
+    n_fft=n_fft or frame_length
+    x=np.memmap(input_path,dtype=dtype,mode="r")
+    n_frames=_frame_count(len(x),frame_length,hop)
+    n_bins=n_fft//2+1
+
+    S=np.lib.format.open_memmap(output_path,mode="w+",dtype=np.float32,shape=(n_frames,n_bins))
+    for t0,spec in iter_stft(x,frame_length,hop,n_fft,window,batch_frames):
+        if scale=="power":
+            S[t0:t0+len(spec)]=spec.real**2+spec.imag**2
+        else:
+            S[t0:t0+len(spec)]=np.abs(spec)
+        S.flush()
+    del S,x
+    return n_frames,n_bins
+
+def run_stft():
+    sampling_rate=8000
+    t=np.arange(10*sampling_rate)/sampling_rate
+    #chirp sweeping from 100 Hz to 3 kHz
+    signal=np.sin(2*np.pi*(100*t+(2900/20)*t**2)).astype(np.float32)
+
+    tmp=tempfile.mkdtemp()
+    raw=os.path.join(tmp,"signal.f32")
+    out=os.path.join(tmp,"spectrogram.npy")
+    try:
+        signal.tofile(raw)
+        n_frames,n_bins=spectrogram_to_file(raw,out,frame_length=512,hop=128)
+        S=np.load(out,mmap_mode="r")
+        peaks=np.argmax(S[::n_frames//5],axis=1)*sampling_rate/512
+        print(f"spectrogram shape: {(n_frames,n_bins)}")
+        print(f"peak frequency every 2 s (Hz): {peaks.tolist()}")
+        del S
+    finally:
+        for f in (raw,out):
+            if os.path.exists(f):
+                os.remove(f)
+        os.rmdir(tmp)
+
+if __name__=="__main__":
+    run_stft()
@@ -35,7 +35,15 @@ Functions():
 3. backward_substitution(U, y, n):
     Solves the upper-triangular system Ux = y.
 
-4. test():
+4. doolittle_LU_in_place(n, A, rows_per_update=256):
+    Same factorization, but overwrites A with L and U packed into
+    one array (L below the diagonal, U on and above it). The unit
+    diagonal of L is implied and not stored. The trailing update is
+    done rows_per_update rows at a time, so its temporary never
+    exceeds rows_per_update*n floats. Raises ZeroDivisionError on a
+    zero pivot, including the last one (a singular matrix).
+
+5. test():
     Defines a 4x4 matrix A and right-hand-side vector B,
     then applies LU decomposition and solves for x.
 
@@ -49,6 +57,11 @@ Notes:
 - This implementation does not use partial pivoting. It works best
   for well-conditioned systems where pivoting isn't required.
 - Ideal for educational purposes or small systems (e.g., 2x2 to 5x5)
+- doolittle_LU_decomposition keeps A, L and U alive at the same time
+  (3 n^2 floats). doolittle_LU_in_place only needs A itself, and the
+  packed result can be passed straight to forward_substitution and
+  backward_substitution since they only read the triangle they need.
+- For matrices too large for memory see out_of_core_LU.py
 
 ======================================================================
 """
@@ -81,6 +94,25 @@ def doolittle_LU_decomposition(n,A):
             L[i][k]=(A[i][k]-p)/U[k][k]
             
     return L,U
+
+def doolittle_LU_in_place(n,A,rows_per_update=256):
+    if not isinstance(A,np.ndarray) or not np.issubdtype(A.dtype,np.floating):
+        raise TypeError("A must be a floating point numpy array to be factored in place")
+    
+    for k in range(n-1):
+        if A[k,k]==0:
+            raise ZeroDivisionError(f"zero pivot at row {k}, LU without pivoting fails")
+        #column k of L
+        A[k+1:n,k]/=A[k,k]
+        #rank-1 update of the trailing submatrix, a few rows at a time so
+        #the temporary never grows beyond rows_per_update*n floats
+        for i in range(k+1,n,rows_per_update):
+            r=min(n,i+rows_per_update)
+            A[i:r,k+1:n]-=np.outer(A[i:r,k],A[k,k+1:n])
+    if n>0 and A[n-1,n-1]==0:#never divided by, but U is singular
+        raise ZeroDivisionError(f"zero pivot at row {n-1}, the matrix is singular")
+        
+    return A
     
 def forward_substitution(L,B,n):
     y=[0]*n
@@ -118,4 +150,5 @@ def test():
    print(f"L:{L}\n\n U:{U}\n")
    print(f"solution vector x:{x}" )
 
-test()
\ No newline at end of file
+if __name__=="__main__":
+    test()
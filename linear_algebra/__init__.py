@@ -0,0 +1,51 @@
+"""
+Linear Algebra
+--------------
+
+Dense, banded, tridiagonal, out-of-core and sparse iterative solvers.
+
+Every name below is imported from its module the first time it is
+used, except thomas_algorithm: it shares the name of its module, so it
+is bound when the package is imported. A lazy binding would be replaced
+by the submodule as soon as anything imported linear_algebra.thomas_algorithm
+(which using thomas_solve already does).
+"""
+
+import importlib
+from linear_algebra.thomas_algorithm import thomas_algorithm
+
+_exports={
+    "doolittle_LU_decomposition":"LU_decomposition",
+    "doolittle_LU_in_place":"LU_decomposition",
+    "forward_substitution":"LU_decomposition",
+    "backward_substitution":"LU_decomposition",
+    "blocked_LU_out_of_core":"out_of_core_LU",
+    "solve_out_of_core":"out_of_core_LU",
+    "thomas_solve":"thomas_algorithm",
+    "constant_thomas_solve":"thomas_algorithm",
+    "thomas_factor":"thomas_algorithm",
+    "thomas_solve_factored":"thomas_algorithm",
+    "batched_thomas_solve":"thomas_algorithm",
+    "cyclic_thomas_solve":"thomas_algorithm",
+    "parallel_thomas_solve":"parallel_tridiagonal",
+    "dense_to_banded":"banded_LU",
+    "banded_LU_decomposition":"banded_LU",
+    "banded_LU_solve":"banded_LU",
+    "CSRMatrix":"sparse_matrix",
+    "conjugate_gradient":"iterative_solvers",
+    "gmres":"iterative_solvers",
+    "jacobi_preconditioner":"iterative_solvers",
+    "ilu0_preconditioner":"iterative_solvers",
+}
+
+__all__=sorted(["thomas_algorithm",*_exports])
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value=getattr(importlib.import_module(f"{__name__}.{_exports[name]}"),name)
+    globals()[name]=value#later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals())|set(__all__))
@@ -0,0 +1,136 @@
+"""
+======================================================================
+Banded LU Decomposition (Doolittle, no pivoting)
+----------------------------------------------------------------------
+
+Overview:
+---------
+Between the tridiagonal-only thomas_algorithm and the dense O(n^3)
+doolittle_LU_decomposition there was nothing for matrices with a small
+fixed bandwidth, e.g. pentadiagonal systems from higher-order splines
+or 1-D fourth-order operators.
+
+A matrix has lower bandwidth kl and upper bandwidth ku when
+A[i][j] = 0 whenever i - j > kl or j - i > ku. Without pivoting the L
+and U factors keep exactly the same band, so the factorization can
+stay in compact storage the whole time.
+
+Compact diagonal-ordered storage (same layout as LAPACK's gbtrf):
+-----------------------------------------------------------------
+ab has shape (kl + ku + 1, n) and
+
+    ab[ku + i - j][j] = A[i][j]
+
+so row ku of ab is the main diagonal, the rows above it are the super
+diagonals and the rows below it the sub diagonals. Example with
+kl = ku = 1 (tridiagonal):
+
+        | b0 c0       |           |  *  c0 c1 c2 |
+    A = | a0 b1 c1    |  ->  ab = | b0  b1 b2 b3 |
+        |    a1 b2 c2 |           | a0  a1 a2  * |
+        |       a2 b3 |
+
+Cost:
+-----
+- factorization : O(n * kl * ku) time
+- each solve    : O(n * (kl + ku)) time per right-hand side
+- memory        : O(n * (kl + ku + 1)), nothing else is allocated
+
+Functions():
+----------------
+1. dense_to_banded(A, kl, ku):
+    Packs a dense matrix into diagonal-ordered storage.
+
+2. banded_LU_decomposition(ab, kl, ku):
+    Returns the L and U factors packed into a copy of ab (L below the
+    diagonal row with its unit diagonal implied, U on and above it).
+
+3. banded_LU_solve(lu, kl, ku, B):
+    Forward and backward substitution with the packed factors. B may be
+    a vector or an (n, k) array of k right-hand sides solved together.
+
+4. test():
+    Factors a pentadiagonal fourth-difference matrix and checks the
+    solution of a few right-hand sides against numpy.
+
+Notes:
+------
+- Like LU_decomposition.py there is no pivoting, so it is meant for
+  diagonally dominant or symmetric positive definite banded matrices.
+
+======================================================================
+"""
+
+import numpy as np
+
+def dense_to_banded(A,kl,ku):
+    A=np.asarray(A,dtype=float)
+    n=A.shape[0]
+    ab=np.zeros((kl+ku+1,n))
+    for d in range(-kl,ku+1):#d>0 super diagonals, d<0 sub diagonals
+        diag=np.diagonal(A,d)
+        if d>=0:
+            ab[ku-d,d:]=diag
+        else:
+            ab[ku-d,:n+d]=diag
+    return ab
+
+def banded_LU_decomposition(ab,kl,ku):
+    lu=np.array(ab,dtype=float)
+    n=lu.shape[1]
+    if lu.shape[0]!=kl+ku+1:
+        raise ValueError("ab must have kl+ku+1 rows")
+
+    for k in range(n):
+        pivot=lu[ku,k]
+        if pivot==0:
+            raise ZeroDivisionError(f"zero pivot at row {k}, LU without pivoting fails")
+        m=min(kl,n-1-k)#rows below the pivot inside the band
+        q=min(ku,n-1-k)#columns right of the pivot inside the band
+        if m==0:
+            continue
+        lu[ku+1:ku+1+m,k]/=pivot
+        if q==0:
+            continue
+        I=np.arange(1,m+1)[:,None]
+        J=np.arange(1,q+1)[None,:]
+        u=lu[ku-J[0],k+J[0]]#row k of U, right of the pivot
+        lu[ku+I-J,k+J]-=lu[ku+1:ku+1+m,k][:,None]*u[None,:]
+
+    return lu
+
+def banded_LU_solve(lu,kl,ku,B):
+    x=np.array(B,dtype=float)
+    n=lu.shape[1]
+    if x.shape[0]!=n:
+        raise ValueError("B must have one row per unknown")
+    single=x.ndim==1
+    if single:
+        x=x[:,None]
+
+    for k in range(n-1):#forward substitution Ly=B
+        m=min(kl,n-1-k)
+        x[k+1:k+1+m]-=lu[ku+1:ku+1+m,k][:,None]*x[k]
+
+    for k in range(n-1,-1,-1):#backward substitution Ux=y
+        x[k]/=lu[ku,k]
+        t=min(ku,k)
+        x[k-t:k]-=lu[ku-t:ku,k][:,None]*x[k]
+
+    return x[:,0] if single else x
+
+def test():
+    n=200
+    #fourth difference operator plus a diagonal shift: [1 -4 6 -4 1] + I
+    A=np.zeros((n,n))
+    for d,v in ((-2,1.0),(-1,-4.0),(0,7.0),(1,-4.0),(2,1.0)):
+        A+=np.diag(np.full(n-abs(d),v),d)
+    B=np.random.default_rng(0).standard_normal((n,3))
+
+    lu=banded_LU_decomposition(dense_to_banded(A,2,2),2,2)
+    X=banded_LU_solve(lu,2,2,B)
+    print(f"band storage shape : {lu.shape}")
+    print(f"max |X - numpy solution| : {np.max(np.abs(X-np.linalg.solve(A,B))):.3e}")
+
+if __name__=="__main__":
+    test()
@@ -0,0 +1,336 @@
+"""
+======================================================================
+Iterative Solvers for Sparse Systems (CG and GMRES)
+----------------------------------------------------------------------
+
+Overview:
+---------
+Dense LU is O(n^3) time and O(n^2) memory. For sparse systems (see
+sparse_matrix.py) iterative methods only ever need the product A @ x,
+so time per iteration is O(nnz) and memory is O(nnz + n).
+
+Solvers:
+--------
+1. conjugate_gradient(A, b, x0, tol, max_iter, preconditioner):
+    For symmetric positive definite A (e.g. the discrete Laplacian).
+    Minimizes the A-norm of the error over a growing Krylov space using
+    only a few work vectors.
+
+2. gmres(A, b, x0, tol, restart, max_iter, preconditioner):
+    For general (non-symmetric) A. Builds an orthonormal Krylov basis
+    with Arnoldi, keeps the least-squares residual up to date with
+    Givens rotations and restarts every `restart` steps to bound memory
+    at (restart+1) vectors of length n. Preconditioning is applied on
+    the right, so the reported residual is the true residual.
+
+Preconditioners (both return a function r -> z ~ A^-1 r):
+-------------------------------------------------------
+3. jacobi_preconditioner(A):
+    z = r / diag(A). Almost free, helps when the diagonal varies a lot.
+
+4. ilu0_preconditioner(A):
+    Incomplete LU with zero fill-in: L and U keep exactly the sparsity
+    pattern of A, so the factors cost no extra memory beyond a copy of
+    A.data. Much stronger than Jacobi.
+    - setup: the (i,k) x (k,j) -> (i,j) update positions are matched
+      for all rows at once (one sorted-key search). Rows are grouped
+      into levels (a row's level is one more than the deepest row its L
+      part refers to), and each level is factored with a few vectorized
+      updates instead of a Python loop over rows.
+    - apply: both triangular solves are level-scheduled the same way,
+      one bincount per level. A 2-D grid of m x m unknowns has about 2m
+      levels, so a 10^6-unknown Poisson matrix needs ~2000 vectorized
+      steps per solve instead of 10^6 Python row steps.
+
+Instrumentation:
+----------------
+Every solver returns (x, info) where info is a dict with
+    "iterations" : number of iterations done
+    "matvecs"    : number of products with A
+    "residuals"  : ||b - A x|| / ||b|| after every iteration
+    "converged"  : True when the residual dropped below tol
+
+5. test():
+    Solves the 2-D Poisson equation on a 100 x 100 grid (10^4 unknowns)
+    with CG, and a convection-diffusion system with GMRES.
+
+Notes:
+------
+- A can be a CSRMatrix or anything else supporting A @ x
+- tol is relative to ||b||
+
+======================================================================
+"""
+
+import numpy as np
+from linear_algebra.sparse_matrix import CSRMatrix
+
+def _identity(r):
+    return r
+
+def jacobi_preconditioner(A):
+    d=A.diagonal()
+    if np.any(d==0):
+        raise ValueError("Jacobi preconditioner needs a nonzero diagonal")
+    inv_d=1.0/d
+    def apply(r):
+        return r*inv_d
+    return apply
+
+def _diagonal_positions(A):
+    n=A.shape[0]
+    rows=A.row_ids()
+    on_diag=np.flatnonzero(rows==A.indices)
+    pos=np.full(n,-1,dtype=np.int64)
+    pos[rows[on_diag]]=on_diag
+    missing=np.flatnonzero(pos<0)
+    if len(missing):
+        raise ValueError(f"row {missing[0]} has no stored diagonal entry, ILU(0) needs one")
+    return pos
+
+def _expand_ranges(starts,lengths):
+    #concatenation of arange(s, s+l) for every (s, l), without a Python loop
+    lengths=np.asarray(lengths,dtype=np.int64)
+    total=int(lengths.sum())
+    if total==0:
+        return np.zeros(0,dtype=np.int64)
+    first=np.asarray(starts,dtype=np.int64)-(np.cumsum(lengths)-lengths)
+    return np.repeat(first,lengths)+np.arange(total)
+
+def _levels(n,src,dst):
+    #level of every row: 0 without dependencies, else 1 + the deepest src it
+    #depends on (edge e means row src[e] must be done before row dst[e])
+    deps=np.bincount(dst,minlength=n)
+    order=np.argsort(src,kind="stable")
+    out_dst=dst[order]
+    out_ptr=np.zeros(n+1,dtype=np.int64)
+    np.cumsum(np.bincount(src,minlength=n),out=out_ptr[1:])
+    level=np.zeros(n,dtype=np.int64)
+    frontier=np.flatnonzero(deps==0)
+    lv=0
+    while len(frontier):
+        level[frontier]=lv
+        nxt=out_dst[_expand_ranges(out_ptr[frontier],out_ptr[frontier+1]-out_ptr[frontier])]
+        rows,count=np.unique(nxt,return_counts=True)
+        deps[rows]-=count
+        frontier=rows[deps[rows]==0]
+        lv+=1
+    return level
+
+class _TriangularSchedule:
+    #rows grouped by level; each level is solved with a few vectorized calls
+    def __init__(self,n,entry_rows,entry_cols,entry_vals,level):
+        self.perm=np.argsort(level,kind="stable")
+        nlev=int(level.max())+1 if n else 0
+        self.row_ptr=np.zeros(nlev+1,dtype=np.int64)
+        np.cumsum(np.bincount(level,minlength=nlev),out=self.row_ptr[1:])
+        rank=np.empty(n,dtype=np.int64)
+        rank[self.perm]=np.arange(n)
+        order=np.argsort(level[entry_rows],kind="stable")
+        self.cols=entry_cols[order]
+        self.vals=entry_vals[order]
+        erows=entry_rows[order]
+        self.local=rank[erows]-self.row_ptr[level[erows]]#row inside its level
+        self.ent_ptr=np.zeros(nlev+1,dtype=np.int64)
+        np.cumsum(np.bincount(level[erows],minlength=nlev),out=self.ent_ptr[1:])
+
+    def solve(self,y,diag=None):
+        #y[i] = (y[i] - sum_j T_ij y[j]) / diag[i], level by level, in place
+        for l in range(len(self.row_ptr)-1):
+            a,b=self.row_ptr[l],self.row_ptr[l+1]
+            R=self.perm[a:b]
+            ea,eb=self.ent_ptr[l],self.ent_ptr[l+1]
+            if eb>ea:
+                y[R]-=np.bincount(self.local[ea:eb],weights=self.vals[ea:eb]*y[self.cols[ea:eb]],minlength=b-a)
+            if diag is not None:
+                y[R]/=diag[R]
+        return y
+
+def ilu0_preconditioner(A):
+    n=A.shape[0]
+    ind,ptr=A.indices,A.indptr
+    LU=A.data.copy()
+    diag=_diagonal_positions(A)
+    rows=A.row_ids()
+    lower=np.flatnonzero(ind<rows)
+    upper=np.flatnonzero(ind>rows)
+    level=_levels(n,ind[lower],rows[lower])
+
+    #pattern match, all rows at once: for every L entry p = (i, k) and every
+    #U entry u = (k, j) of row k, the stored position q of (i, j), if any
+    u_len=ptr[ind[lower]+1]-diag[ind[lower]]-1
+    P=np.repeat(lower,u_len)
+    U=_expand_ranges(diag[ind[lower]]+1,u_len)
+    keys=rows*n+ind#sorted, CSR keeps the columns of a row sorted
+    want=rows[P]*n+ind[U]
+    Q=np.minimum(np.searchsorted(keys,want),len(keys)-1)
+    hit=keys[Q]==want#zero fill-in: only entries already stored
+    P,U,Q=P[hit],U[hit],Q[hit]
+
+    #a row at level l waits for its L rows (lower levels); inside a row the
+    #t-th L entry needs the updates of entries 0..t-1, so the factorization
+    #runs in steps (level, t), each one vectorized over all rows of the level
+    t=lower-ptr[rows[lower]]
+    step=level[rows[lower]]*(int(t.max())+1 if len(t) else 1)+t
+    order=np.argsort(step,kind="stable")
+    Ls,steps=lower[order],step[order]
+    bounds=np.flatnonzero(np.diff(steps))+1
+    pstep=np.empty(len(LU),dtype=np.int64)
+    pstep[lower]=step
+    order=np.argsort(pstep[P],kind="stable")
+    P,U,Q=P[order],U[order],Q[order]
+    pair_bounds=np.searchsorted(pstep[P],steps[np.r_[0,bounds]]) if len(P) else np.zeros(len(bounds)+1,dtype=np.int64)
+    pair_bounds=np.r_[pair_bounds,len(P)]
+    for g,(a,b) in enumerate(zip(np.r_[0,bounds],np.r_[bounds,len(Ls)])):
+        p=Ls[a:b]
+        LU[p]/=LU[diag[ind[p]]]
+        s,e=pair_bounds[g],pair_bounds[g+1]
+        LU[Q[s:e]]-=LU[P[s:e]]*LU[U[s:e]]
+
+    forward=_TriangularSchedule(n,rows[lower],ind[lower],LU[lower],level)
+    #U z = y goes bottom-up: row i waits for the rows j > i of its U entries
+    backward=_TriangularSchedule(n,rows[upper],ind[upper],LU[upper],_levels(n,ind[upper],rows[upper]))
+    udiag=LU[diag]
+
+    def apply(r):
+        y=np.array(r,dtype=float)
+        forward.solve(y)#L y = r (unit diagonal)
+        return backward.solve(y,udiag)#U z = y
+    return apply
+
+def conjugate_gradient(A,b,x0=None,tol=1e-8,max_iter=None,preconditioner=None):
+    b=np.asarray(b,dtype=float)
+    n=len(b)
+    M=preconditioner or _identity
+    max_iter=max_iter or 10*n
+    x=np.zeros(n) if x0 is None else np.array(x0,dtype=float)
+    b_norm=np.linalg.norm(b) or 1.0
+
+    r=b-A@x
+    z=M(r)
+    p=z.copy()
+    rz=r@z
+    info={"iterations":0,"matvecs":1,"residuals":[np.linalg.norm(r)/b_norm],"converged":False}
+    if info["residuals"][-1]<tol:
+        info["converged"]=True
+        return x,info
+
+    for k in range(1,max_iter+1):
+        Ap=A@p
+        alpha=rz/(p@Ap)
+        x+=alpha*p
+        r-=alpha*Ap
+        info["iterations"]=k
+        info["matvecs"]+=1
+        info["residuals"].append(np.linalg.norm(r)/b_norm)
+        if info["residuals"][-1]<tol:
+            info["converged"]=True
+            break
+
+        z=M(r)
+        rz_new=r@z
+        p*=rz_new/rz
+        p+=z
+        rz=rz_new
+
+    return x,info
+
+def gmres(A,b,x0=None,tol=1e-8,restart=30,max_iter=None,preconditioner=None):
+    b=np.asarray(b,dtype=float)
+    n=len(b)
+    M=preconditioner or _identity
+    max_iter=max_iter or 10*n
+    restart=min(restart,n)
+    x=np.zeros(n) if x0 is None else np.array(x0,dtype=float)
+    b_norm=np.linalg.norm(b) or 1.0
+
+    V=np.zeros((restart+1,n))
+    H=np.zeros((restart+1,restart))
+    info={"iterations":0,"matvecs":0,"residuals":[],"converged":False}
+
+    while True:
+        r=b-A@x
+        info["matvecs"]+=1
+        beta=np.linalg.norm(r)
+        if not info["residuals"]:
+            info["residuals"].append(beta/b_norm)
+        if beta/b_norm<tol:
+            info["converged"]=True
+            break
+        if info["iterations"]>=max_iter:
+            break
+
+        V[0]=r/beta
+        H[:]=0.0
+        cs=np.zeros(restart)
+        sn=np.zeros(restart)
+        g=np.zeros(restart+1)
+        g[0]=beta
+
+        for j in range(restart):
+            w=A@M(V[j])
+            info["matvecs"]+=1
+            info["iterations"]+=1
+            for i in range(j+1):#modified Gram-Schmidt
+                H[i,j]=w@V[i]
+                w-=H[i,j]*V[i]
+            H[j+1,j]=np.linalg.norm(w)
+            if H[j+1,j]!=0:
+                V[j+1]=w/H[j+1,j]
+
+            for i in range(j):#earlier Givens rotations
+                H[i,j],H[i+1,j]=cs[i]*H[i,j]+sn[i]*H[i+1,j],-sn[i]*H[i,j]+cs[i]*H[i+1,j]
+            rho=np.hypot(H[j,j],H[j+1,j])
+            cs[j],sn[j]=H[j,j]/rho,H[j+1,j]/rho
+            H[j,j]=rho
+            H[j+1,j]=0.0
+            g[j],g[j+1]=cs[j]*g[j],-sn[j]*g[j]
+
+            info["residuals"].append(abs(g[j+1])/b_norm)
+            if info["residuals"][-1]<tol or info["iterations"]>=max_iter:
+                break
+        k=j+1
+
+        y=np.zeros(k)
+        for i in range(k-1,-1,-1):#back substitution on the rotated H
+            y[i]=(g[i]-H[i,i+1:k]@y[i+1:k])/H[i,i]
+        x+=M(V[:k].T@y)
+
+    return x,info
+
+def _poisson_2d(m):
+    #5-point Laplacian on an m x m interior grid
+    idx=np.arange(m*m).reshape(m,m)
+    rows=[idx.ravel()]
+    cols=[idx.ravel()]
+    vals=[np.full(m*m,4.0)]
+    for a,b in ((idx[1:,:],idx[:-1,:]),(idx[:-1,:],idx[1:,:]),(idx[:,1:],idx[:,:-1]),(idx[:,:-1],idx[:,1:])):
+        rows.append(a.ravel())
+        cols.append(b.ravel())
+        vals.append(np.full(a.size,-1.0))
+    return CSRMatrix.from_coo(np.concatenate(rows),np.concatenate(cols),np.concatenate(vals),(m*m,m*m))
+
+def test():
+    A=_poisson_2d(100)
+    b=np.ones(A.shape[0])
+    print(A)
+
+    for name,M in (("none",None),("jacobi",jacobi_preconditioner(A)),("ilu0",ilu0_preconditioner(A))):
+        x,info=conjugate_gradient(A,b,tol=1e-8,preconditioner=M)
+        print(f"CG    preconditioner={name:6s} iterations={info['iterations']:4d} "
+              f"residual={np.linalg.norm(b-A@x)/np.linalg.norm(b):.2e}")
+
+    #add a first-order convection term to make the matrix non-symmetric
+    m=100
+    n=m*m
+    i=np.arange(n-1)
+    keep=(i+1)%m!=0
+    C=CSRMatrix.from_coo(np.concatenate([A.row_ids(),i[keep]]),np.concatenate([A.indices,i[keep]+1]),
+                         np.concatenate([A.data,np.full(keep.sum(),0.5)]),(n,n))
+    for name,M in (("jacobi",jacobi_preconditioner(C)),("ilu0",ilu0_preconditioner(C))):
+        x,info=gmres(C,b,tol=1e-8,restart=40,preconditioner=M)
+        print(f"GMRES preconditioner={name:6s} iterations={info['iterations']:4d} "
+              f"residual={np.linalg.norm(b-C@x)/np.linalg.norm(b):.2e}")
+
+if __name__=="__main__":
+    test()
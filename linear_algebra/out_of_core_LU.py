@@ -0,0 +1,164 @@
+"""
+======================================================================
+Out-of-Core Blocked LU Decomposition (Doolittle, no pivoting)
+----------------------------------------------------------------------
+
+Overview:
+---------
+doolittle_LU_decomposition in LU_decomposition.py needs A, L and U in
+memory at once. This script factors a matrix that lives in a binary
+file on disk (read through numpy.memmap) one square tile at a time,
+so the matrix can be much larger than physical memory.
+
+The factorization is written back into the same file in packed form:
+    - below the diagonal : L (unit diagonal is implied, not stored)
+    - on/above diagonal  : U
+
+Blocked algorithm (right-looking, tile size b, nb = ceil(n/b) tiles):
+
+    for k in 0..nb-1:
+        A_kk        <- LU(A_kk)                      (factor diagonal tile)
+        A_kj, j>k   <- L_kk^-1 A_kj                  (row panel of U)
+        A_ik, i>k   <- A_ik U_kk^-1                  (column panel of L)
+        A_ij, i,j>k <- A_ij - A_ik A_kj              (trailing update)
+
+Only three tiles are held in memory at any time (3 b^2 floats), and
+the number of tile reads/writes is fixed by n and b alone:
+roughly nb^3/3 tile reads and writes for the trailing updates, so the
+I/O cost is predictable before the run starts.
+
+Functions():
+----------------
+1. blocked_LU_out_of_core(path, n, block_size, dtype):
+    Factors the n x n matrix stored row-major in `path` in place.
+
+2. solve_out_of_core(path, n, B, block_size, dtype):
+    Solves Ax = B with a file already factored by
+    blocked_LU_out_of_core, using blocked forward and backward
+    substitution (each tile is read once per sweep).
+
+3. test():
+    Writes a diagonally dominant matrix to a temporary file, factors
+    it tile by tile and checks the solution against numpy.
+
+Notes:
+------
+- Like LU_decomposition.py there is no pivoting, so the matrix should
+  be diagonally dominant or otherwise safe to factor without it.
+- Pick block_size so that 3 * block_size^2 floats fit comfortably in
+  memory; larger tiles mean fewer, bigger reads.
+
+======================================================================
+"""
+
+import os
+import tempfile
+import numpy as np
+
+
+def _lu_tile(T):
+    #in-place Doolittle on a tile held in memory
+    b=T.shape[0]
+    for k in range(b-1):
+        if T[k,k]==0:
+            raise ZeroDivisionError("zero pivot in diagonal tile, LU without pivoting fails")
+        T[k+1:,k]/=T[k,k]
+        T[k+1:,k+1:]-=np.outer(T[k+1:,k],T[k,k+1:])
+    if b>0 and T[b-1,b-1]==0:#never divided by here, but later tile solves would
+        raise ZeroDivisionError("zero pivot in diagonal tile, LU without pivoting fails")
+    return T
+
+def _unit_lower_solve(T,B):
+    #solves L X = B where L is the unit lower triangle of T
+    X=np.array(B,dtype=T.dtype)
+    for i in range(1,T.shape[0]):
+        X[i]-=T[i,:i]@X[:i]
+    return X
+
+def _upper_solve(T,B):
+    #solves U X = B where U is the upper triangle of T
+    X=np.array(B,dtype=T.dtype)
+    for i in range(T.shape[0]-1,-1,-1):
+        X[i]=(X[i]-T[i,i+1:]@X[i+1:])/T[i,i]
+    return X
+
+def _upper_right_solve(T,B):
+    #solves X U = B where U is the upper triangle of T
+    X=np.array(B,dtype=T.dtype)
+    for j in range(T.shape[0]):
+        X[:,j]=(X[:,j]-X[:,:j]@T[:j,j])/T[j,j]
+    return X
+
+def blocked_LU_out_of_core(path,n,block_size=1024,dtype=np.float64):
+    A=np.memmap(path,dtype=dtype,mode='r+',shape=(n,n))
+    b=block_size
+    starts=list(range(0,n,b))
+
+    for k0 in starts:
+        k1=min(n,k0+b)
+        Akk=_lu_tile(np.array(A[k0:k1,k0:k1]))
+        A[k0:k1,k0:k1]=Akk
+
+        for j0 in range(k1,n,b):#row panel of U
+            j1=min(n,j0+b)
+            A[k0:k1,j0:j1]=_unit_lower_solve(Akk,A[k0:k1,j0:j1])
+
+        for i0 in range(k1,n,b):#column panel of L
+            i1=min(n,i0+b)
+            A[i0:i1,k0:k1]=_upper_right_solve(Akk,A[i0:i1,k0:k1])
+
+        for i0 in range(k1,n,b):#trailing update, one tile at a time
+            i1=min(n,i0+b)
+            Lik=np.array(A[i0:i1,k0:k1])
+            for j0 in range(k1,n,b):
+                j1=min(n,j0+b)
+                A[i0:i1,j0:j1]-=Lik@A[k0:k1,j0:j1]
+        A.flush()
+
+    del A
+
+def solve_out_of_core(path,n,B,block_size=1024,dtype=np.float64):
+    A=np.memmap(path,dtype=dtype,mode='r',shape=(n,n))
+    b=block_size
+    y=np.array(B,dtype=dtype)
+
+    for i0 in range(0,n,b):#forward substitution Ly=B
+        i1=min(n,i0+b)
+        for j0 in range(0,i0,b):
+            j1=min(n,j0+b)
+            y[i0:i1]-=A[i0:i1,j0:j1]@y[j0:j1]
+        y[i0:i1]=_unit_lower_solve(np.array(A[i0:i1,i0:i1]),y[i0:i1])
+
+    x=y
+    for i0 in reversed(range(0,n,b)):#backward substitution Ux=y
+        i1=min(n,i0+b)
+        for j0 in range(i1,n,b):
+            j1=min(n,j0+b)
+            x[i0:i1]-=A[i0:i1,j0:j1]@x[j0:j1]
+        x[i0:i1]=_upper_solve(np.array(A[i0:i1,i0:i1]),x[i0:i1])
+
+    del A
+    return x
+
+def test():
+    n=300
+    rng=np.random.default_rng(0)
+    A=rng.standard_normal((n,n))+n*np.eye(n)
+    B=rng.standard_normal(n)
+
+    fd,path=tempfile.mkstemp(suffix=".dat")
+    os.close(fd)
+    try:
+        M=np.memmap(path,dtype=np.float64,mode='w+',shape=(n,n))
+        M[:]=A
+        M.flush()
+        del M
+
+        blocked_LU_out_of_core(path,n,block_size=64)
+        x=solve_out_of_core(path,n,B,block_size=64)
+        print(f"max |x - numpy solution| : {np.max(np.abs(x-np.linalg.solve(A,B))):.3e}")
+    finally:
+        os.remove(path)
+
+if __name__=="__main__":
+    test()
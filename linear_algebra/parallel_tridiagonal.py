@@ -0,0 +1,295 @@
+"""
+======================================================================
+Partitioned (Parallel) Tridiagonal Solver
+----------------------------------------------------------------------
+
+Overview:
+---------
+The Thomas sweep in thomas_algorithm.py is strictly sequential: row i
+can only be eliminated after row i-1. For a single huge system that
+means one core does all the work.
+
+This script splits the system into p blocks separated by single
+"separator" rows and solves the blocks concurrently in a process pool.
+All arrays live in multiprocessing shared memory, so the workers read
+and write them without copying.
+
+How it works:
+-------------
+Pick separator rows s_0 < s_1 < ... < s_(p-2). Block j holds the rows
+between two separators. Inside a block every unknown depends on the
+block's own rows plus the two neighbouring separator values XL and XR:
+
+    T_j y = d_j                 (the block on its own)
+    T_j v = a * e_first         (coupling to the left separator)
+    T_j w = c * e_last          (coupling to the right separator)
+
+and then   x_block = y - v*XL - w*XR.
+
+Only y needs a real solve. v and w are scaled first and last columns
+of T_j^-1, and those columns are geometric-like products of numbers
+that only depend on the matrix:
+
+    w[i] = w[i+1] * (-c_i / b'_i)         b' = pivots of the forward
+                                           elimination done for y
+    v[i+1] = v[i] * (-a_i / u_(i+1))      u  = pivots of the same
+                                           elimination run bottom-up
+
+so each is one np.cumprod. Each worker runs three scalar loops (the
+two sweeps for y and the bottom-up pivots), on Python floats rather
+than NumPy scalars, instead of a 3-column Thomas sweep.
+
+A Python float costs 32 bytes against 8 in an array, so the loops
+never convert a whole block: they go over segments of _SEGMENT rows
+and carry the recurrence (last pivot, last value, running product)
+from one segment to the next. The pivots are kept in the shared v and
+w arrays, which the spikes then overwrite in place, so a worker's
+private memory is O(_SEGMENT) whatever the block size.
+
+Putting that into the separator rows gives a small tridiagonal system
+of size p-1 for the separator values:
+
+    -a_s v_(s-1) X_(k-1)
+      + (b_s - a_s w_(s-1) - c_s v_(s+1)) X_k
+      - c_s w_(s+1) X_(k+1)  =  d_s - a_s y_(s-1) - c_s y_(s+1)
+
+which is solved serially with thomas_solve. A second parallel pass
+then stitches every block together with the formula above.
+
+Functions():
+----------------
+1. parallel_thomas_solve(a, b, c, d, workers, min_block):
+    Same arguments as thomas_solve (a, c sub/super diagonals of length
+    n-1, b, d of length n), except that d must be 1-D: one right-hand
+    side per call (ValueError otherwise). Falls back to the serial
+    solver when the system is too small to be worth splitting.
+
+2. test():
+    Solves a random diagonally dominant system on all cores and
+    compares it with the serial Thomas result.
+
+Notes:
+------
+- Work is O(n) per pass and the reduced system is only p-1 unknowns,
+  so run time scales with the number of cores on large n.
+  benchmarks/run_benchmarks.py reports the measured speedup over the
+  serial thomas_solve.
+- No pivoting, like the rest of linear_algebra; the matrix should be
+  diagonally dominant.
+
+======================================================================
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from linear_algebra.thomas_algorithm import thomas_solve
+
+_NAMES=("a","b","c","d","y","v","w")
+_SEGMENT=1<<14#rows converted to Python floats at a time in a worker
+
+def _attach(names,n):
+    #opens the shared arrays by name, keeps the handles alive with the views
+    handles={k:shared_memory.SharedMemory(name=names[k]) for k in _NAMES}
+    arrays={k:np.ndarray((n-1 if k in ("a","c") else n,),dtype=np.float64,buffer=handles[k].buf) for k in _NAMES}
+    return handles,arrays
+
+def _forward_sweep(a,b,c,d,bp,y):
+    #forward elimination, segment by segment: pivots into bp, rhs into y
+    m=len(b)
+    p=q=0.0#pivot and eliminated rhs of the previous row
+    for lo in range(0,m,_SEGMENT):
+        hi=min(lo+_SEGMENT,m)
+        bl=b[lo:hi].tolist()
+        yl=d[lo:hi].tolist()
+        first=0
+        if lo==0:
+            p,q=bl[0],yl[0]
+            first=1
+        al=a[lo-1+first:hi-1].tolist()#row i uses a[i-1], c[i-1]
+        cl=c[lo-1+first:hi-1].tolist()
+        for k in range(first,hi-lo):
+            r=al[k-first]/p
+            p=bl[k]-r*cl[k-first]
+            q=yl[k]-r*q
+            bl[k]=p
+            yl[k]=q
+        bp[lo:hi]=bl
+        y[lo:hi]=yl
+
+def _backward_sweep(c,bp,y):
+    #backward substitution in place on y, last segment first
+    m=len(y)
+    x=0.0#solution of the row below
+    for hi in range(m,0,-_SEGMENT):
+        lo=max(hi-_SEGMENT,0)
+        yl=y[lo:hi].tolist()
+        pl=bp[lo:hi].tolist()
+        cl=c[lo:hi].tolist()
+        if hi==m:
+            cl.append(0.0)#the last row has no super-diagonal
+        for k in range(hi-lo-1,-1,-1):
+            x=(yl[k]-cl[k]*x)/pl[k]
+            yl[k]=x
+        y[lo:hi]=yl
+
+def _upward_pivots(a,b,c,u):
+    #pivots of the elimination run bottom-up: u[i] = b[i] - c[i]*a[i]/u[i+1]
+    m=len(b)
+    p=0.0
+    for hi in range(m,0,-_SEGMENT):
+        lo=max(hi-_SEGMENT,0)
+        bl=b[lo:hi].tolist()
+        al=a[lo:hi].tolist()
+        cl=c[lo:hi].tolist()
+        last=hi-lo-1
+        if hi==m:
+            p=bl[last]
+            last-=1
+        for k in range(last,-1,-1):
+            p=bl[k]-cl[k]*al[k]/p
+            bl[k]=p
+        u[lo:hi]=bl
+
+def _block_spikes(a,b,c,d,y,v,w,left,right):
+    #y = T^-1 d, v = T^-1 e_first, w = T^-1 e_last, written into the given
+    #float64 views; v and w hold the pivots until the spikes replace them
+    m=len(b)
+    _forward_sweep(a,b,c,d,w,y)
+    _backward_sweep(c,w,y)
+
+    if left:#first column: v[0] = 1/u[0], v[i] = v[i-1]*(-a[i-1]/u[i])
+        _upward_pivots(a,b,c,v)
+        run=1.0
+        for lo in range(0,m,_SEGMENT):
+            hi=min(lo+_SEGMENT,m)
+            f=np.empty(hi-lo)
+            if lo==0:
+                f[0]=1.0/v[0]
+                np.divide(-a[0:hi-1],v[1:hi],out=f[1:])
+            else:
+                np.divide(-a[lo-1:hi-1],v[lo:hi],out=f)
+            np.cumprod(f,out=f)
+            f*=run
+            run=f[-1]
+            v[lo:hi]=f
+    else:
+        v[:]=0.0
+    if right:#last column: w[m-1] = 1/b'[m-1], w[i] = w[i+1]*(-c[i]/b'[i])
+        run=1.0
+        for hi in range(m,0,-_SEGMENT):
+            lo=max(hi-_SEGMENT,0)
+            f=np.empty(hi-lo)
+            if hi==m:
+                f[-1]=1.0/w[m-1]
+                np.divide(-c[lo:m-1],w[lo:m-1],out=f[:-1])
+            else:
+                np.divide(-c[lo:hi],w[lo:hi],out=f)
+            f=np.cumprod(f[::-1])[::-1]
+            f*=run
+            run=f[0]
+            w[lo:hi]=f
+    else:
+        w[:]=0.0
+
+def _solve_block(names,n,s,e):
+    handles,A=_attach(names,n)
+    try:
+        y,v,w=A["y"][s:e],A["v"][s:e],A["w"][s:e]
+        _block_spikes(A["a"][s:e-1],A["b"][s:e],A["c"][s:e-1],A["d"][s:e],y,v,w,s>0,e<n)
+        if s>0:
+            v*=A["a"][s-1]
+        if e<n:
+            w*=A["c"][e-1]
+        del A,y,v,w
+    finally:
+        for h in handles.values():
+            h.close()
+
+def _stitch_block(names,n,s,e,XL,XR):
+    handles,A=_attach(names,n)
+    try:
+        #y is overwritten with the final solution
+        A["y"][s:e]-=A["v"][s:e]*XL+A["w"][s:e]*XR
+        del A
+    finally:
+        for h in handles.values():
+            h.close()
+
+def parallel_thomas_solve(a,b,c,d,workers=None,min_block=100_000):
+    if np.ndim(d)!=1:
+        raise ValueError("d must be 1-D: one right-hand side per call")
+    n=len(d)
+    if len(b)!=n or len(a)!=n-1 or len(c)!=n-1:
+        raise ValueError("expected len(b)==len(d) and len(a)==len(c)==len(d)-1")
+    workers=workers or os.cpu_count() or 1
+    p=min(workers,n//max(min_block,1),(n+1)//2)
+    if p<2:
+        return thomas_solve(a,b,c,d)
+
+    #p blocks separated by p-1 single separator rows
+    seps=[(k+1)*n//p for k in range(p-1)]
+    blocks=list(zip([0]+[s+1 for s in seps],seps+[n]))
+
+    shms={}
+    A={}
+    try:
+        for k in _NAMES:
+            size=n-1 if k in ("a","c") else n
+            shms[k]=shared_memory.SharedMemory(create=True,size=max(size,1)*8)
+        names={k:shms[k].name for k in _NAMES}
+        A.update({k:np.ndarray((n-1 if k in ("a","c") else n,),dtype=np.float64,buffer=shms[k].buf) for k in _NAMES})
+        A["a"][:]=a
+        A["b"][:]=b
+        A["c"][:]=c
+        A["d"][:]=d
+
+        with ProcessPoolExecutor(max_workers=p) as pool:
+            for f in [pool.submit(_solve_block,names,n,s,e) for s,e in blocks]:
+                f.result()
+
+            #reduced tridiagonal system for the separator values
+            ra=np.zeros(p-2)
+            rb=np.zeros(p-1)
+            rc=np.zeros(p-2)
+            rd=np.zeros(p-1)
+            for k,s in enumerate(seps):
+                al,cs=A["a"][s-1],A["c"][s]
+                rb[k]=A["b"][s]-al*A["w"][s-1]-cs*A["v"][s+1]
+                rd[k]=A["d"][s]-al*A["y"][s-1]-cs*A["y"][s+1]
+                if k>0:
+                    ra[k-1]=-al*A["v"][s-1]
+                if k<p-2:
+                    rc[k]=-cs*A["w"][s+1]
+            X=thomas_solve(ra,rb,rc,rd)
+
+            bounds=[0.0]+list(X)+[0.0]
+            futures=[pool.submit(_stitch_block,names,n,s,e,bounds[j],bounds[j+1])
+                     for j,(s,e) in enumerate(blocks)]
+            for f in futures:
+                f.result()
+
+        x=np.array(A["y"])
+        x[seps]=X
+        return x
+    finally:
+        A.clear()#views must go before the shared blocks are closed
+        for h in shms.values():
+            h.close()
+            h.unlink()
+
+def test():
+    n=400_000
+    rng=np.random.default_rng(0)
+    a=rng.random(n-1)
+    c=rng.random(n-1)
+    b=2.5+rng.random(n)
+    d=rng.random(n)
+
+    x=parallel_thomas_solve(a,b,c,d,min_block=20_000)
+    x_serial=thomas_solve(a,b,c,d)
+    print(f"max |parallel - serial| : {np.max(np.abs(x-x_serial)):.3e}")
+
+if __name__=="__main__":
+    test()
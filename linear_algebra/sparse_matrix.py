@@ -0,0 +1,120 @@
+"""
+======================================================================
+Compressed Sparse Row (CSR) Matrix
+----------------------------------------------------------------------
+
+Overview:
+---------
+LU_decomposition.py works on dense np.zeros((n,n)) arrays, which is
+hopeless for discretized PDEs with 10^6 unknowns and only a handful of
+nonzeros per row. The CSR format stores only the nonzeros, row by row:
+
+    data    : the nonzero values                      (length nnz)
+    indices : the column of each value                (length nnz)
+    indptr  : row i lives in data[indptr[i]:indptr[i+1]] (length n+1)
+
+Example:
+--------
+        | 4 1 0 |
+    A = | 1 4 1 |   ->   data    = [4 1 1 4 1 1 4]
+        | 0 1 4 |        indices = [0 1 0 1 2 1 2]
+                         indptr  = [0 2 5 7]
+
+What It Does:
+-------------
+✔ Builds a CSR matrix from (row, col, value) triplets or a dense array
+  (duplicate triplets are summed, columns are kept sorted in each row)
+✔ Vectorized mat-vec y = A @ x with no Python loop over the rows
+✔ Diagonal extraction and conversion back to dense for small checks
+
+Memory use is O(nnz + n): the values, their column indices, the row
+pointers and (once the first mat-vec is done) a cached row index per
+nonzero.
+
+Class:
+------
+CSRMatrix(data, indices, indptr, shape)
+    CSRMatrix.from_coo(rows, cols, values, shape)
+    CSRMatrix.from_dense(A)
+    A.matvec(x)   or   A @ x
+    A.diagonal()
+    A.to_dense()
+
+See iterative_solvers.py for conjugate gradient and GMRES built on it.
+
+======================================================================
+"""
+
+import numpy as np
+
+class CSRMatrix:
+    def __init__(self,data,indices,indptr,shape):
+        self.data=np.asarray(data,dtype=float)
+        self.indices=np.asarray(indices,dtype=np.int64)
+        self.indptr=np.asarray(indptr,dtype=np.int64)
+        self.shape=(int(shape[0]),int(shape[1]))
+        if len(self.indptr)!=self.shape[0]+1:
+            raise ValueError("indptr must have n_rows+1 entries")
+        if len(self.data)!=len(self.indices) or self.indptr[-1]!=len(self.data):
+            raise ValueError("data, indices and indptr do not describe the same nonzeros")
+        self._rows=None
+
+    @classmethod
+    def from_coo(cls,rows,cols,values,shape):
+        rows=np.asarray(rows,dtype=np.int64)
+        cols=np.asarray(cols,dtype=np.int64)
+        values=np.asarray(values,dtype=float)
+
+        #sort by (row, col) and sum duplicate entries
+        order=np.lexsort((cols,rows))
+        rows,cols,values=rows[order],cols[order],values[order]
+        if len(rows)>0:
+            new=np.ones(len(rows),dtype=bool)
+            new[1:]=(rows[1:]!=rows[:-1])|(cols[1:]!=cols[:-1])
+            starts=np.flatnonzero(new)
+            values=np.add.reduceat(values,starts)
+            rows,cols=rows[starts],cols[starts]
+
+        indptr=np.zeros(shape[0]+1,dtype=np.int64)
+        np.cumsum(np.bincount(rows,minlength=shape[0]),out=indptr[1:])
+        return cls(values,cols,indptr,shape)
+
+    @classmethod
+    def from_dense(cls,A):
+        A=np.asarray(A,dtype=float)
+        rows,cols=np.nonzero(A)
+        return cls.from_coo(rows,cols,A[rows,cols],A.shape)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def row_ids(self):
+        #row index of every stored nonzero, built once
+        if self._rows is None:
+            self._rows=np.repeat(np.arange(self.shape[0]),np.diff(self.indptr))
+        return self._rows
+
+    def matvec(self,x):
+        x=np.asarray(x,dtype=float)
+        if x.shape!=(self.shape[1],):
+            raise ValueError(f"x must have shape ({self.shape[1]},)")
+        return np.bincount(self.row_ids(),weights=self.data*x[self.indices],minlength=self.shape[0])
+
+    def __matmul__(self,x):
+        return self.matvec(x)
+
+    def diagonal(self):
+        rows=self.row_ids()
+        on_diag=rows==self.indices
+        d=np.zeros(min(self.shape))
+        d[rows[on_diag]]=self.data[on_diag]
+        return d
+
+    def to_dense(self):
+        A=np.zeros(self.shape)
+        A[self.row_ids(),self.indices]=self.data
+        return A
+
+    def __repr__(self):
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz})"
@@ -2,18 +2,72 @@
 Thomas Algorithm for Tridiagonal Systems
 ----------------------------------------
 
-This Python function implements the **Thomas Algorithm**, an efficient method 
-to solve tridiagonal linear systems of equations. It is especially useful for 
-numerical applications such as **natural cubic spline interpolation**.
-
-Function:
----------
-- thomas_algorithm(x, y):
-    Solves a tridiagonal system derived from the natural cubic spline formulation
-    and returns the second derivatives (M values) at each data point.
-
-Parameters:
------------
+This Python module implements the **Thomas Algorithm**, an efficient O(n)
+method to solve tridiagonal linear systems of equations. It is especially
+useful for numerical applications such as **natural cubic spline
+interpolation** and implicit PDE line sweeps.
+
+A tridiagonal system of size n is described by four arrays:
+
+    | b0 c0                |   | x0   |   | d0   |
+    | a0 b1 c1             |   | x1   |   | d1   |
+    |    a1 b2 c2          | * | x2   | = | d2   |
+    |       ...  ...  ...  |   | ...  |   | ...  |
+    |          a(n-2) b(n-1)|  | x(n-1)|  | d(n-1)|
+
+    a : sub-diagonal   (length n-1)
+    b : main diagonal  (length n)
+    c : super-diagonal (length n-1)
+    d : right-hand side (length n)
+
+Functions:
+----------
+- thomas_solve(a, b, c, d):
+    Solves one general tridiagonal system. d may also be a 2-D array of
+    shape (n, k) holding k right-hand sides that share the same matrix.
+
+- batched_thomas_solve(a, b, c, d):
+    Solves many independent tridiagonal systems at once. Every argument
+    has shape (batch, length) and each row is its own system. The sweep
+    runs over the n unknowns while every step is vectorized across the
+    batch axis, so thousands of systems cost about as much Python work
+    as one.
+
+- cyclic_thomas_solve(a, b, c, d, alpha, beta):
+    Solves a cyclic (periodic) tridiagonal system, i.e. the matrix above
+    plus two corner entries: alpha at row n-1, column 0 and beta at
+    row 0, column n-1. The corners are removed with a Sherman-Morrison
+    correction, so it costs two Thomas sweeps (done together as one
+    sweep with two right-hand sides) and stays O(n) instead of falling
+    back to dense LU.
+
+- thomas_factor(a, b, c) / thomas_solve_factored(factor, d):
+    Splits thomas_solve into the part that only depends on the matrix
+    (multipliers and pivots of the forward elimination, done once) and
+    the part that depends on d. Many right-hand sides with the same
+    matrix, e.g. many curves on the same spline knots, then cost one
+    factorization plus one vectorized sweep over an (n, k) array.
+
+- constant_thomas_solve(a, b, c, d):
+    Same as thomas_solve for a matrix with constant diagonals (scalars
+    a, b, c), e.g. a spline on evenly spaced knots. The eliminated
+    diagonal converges to the fixed point b' = (b + sqrt(b^2 - 4ac))/2
+    within a few rows; after that both sweeps are the recurrence
+    y[i] = e[i] + r*y[i-1] with |r| < 1, whose terms fall below machine
+    epsilon after K ~ 30 steps, so it is applied as K vectorized
+    shifted adds instead of a Python loop over n. When a filter root
+    is not below 1 in magnitude (the matrix is not diagonally dominant)
+    or K would exceed 256, it falls back to thomas_solve.
+
+- thomas_algorithm(x, y, uniform=False):
+    Builds the natural cubic spline system from the data and returns the
+    second derivatives (M values) at each data point. uniform=True
+    declares x evenly spaced and solves with constant_thomas_solve (one
+    averaged step for the matrix, so only for knots that really are
+    evenly spaced); the default is the exact sweep on the actual spacings.
+
+Parameters (thomas_algorithm):
+------------------------------
 - x : list of float
     List of strictly increasing x-values (independent variable).
 - y : list of float
@@ -27,53 +81,218 @@ Returns:
 
 Steps:
 ------
-1. Compute interval widths h
-2. Form coefficient vectors a, b, c and right-hand side vector d
-3. Perform forward elimination
-4. Perform backward substitution to obtain M
-
-Usage:
-------
-Use this function within a cubic spline interpolation module to compute 
-the second derivatives needed for spline segment equations.
+1. Forward elimination: remove the sub-diagonal row by row
+2. Backward substitution: recover x from the last row upwards
 
 Example:
 --------
     M = thomas_algorithm(x, y)
+    x = thomas_solve(a, b, c, d)
+    x = constant_thomas_solve(1.0, 4.0, 1.0, d)
+    x = thomas_solve_factored(thomas_factor(a, b, c), D)   # D.shape == (n, k)
+    X = batched_thomas_solve(A, B, C, D)   # A.shape == (batch, n-1)
+    x = cyclic_thomas_solve(a, b, c, d, alpha, beta)
 
 Notes:
 ------
-- Assumes natural spline conditions: M[0] = M[n] = 0
+- No pivoting is done, the matrix should be diagonally dominant
+  (true for spline and implicit diffusion systems)
+- Assumes natural spline conditions in thomas_algorithm: M[0] = M[n] = 0
 - Input x must be strictly increasing
 - Only supports interpolation (not extrapolation)
 
 
 """
 
-def thomas_algorithm(x,y):
-    n=len(x)
-    h=[x[i+1]-x[i] for i in range(n-1)]
-    a=[0]*(n-2)
-    b=[0]*(n-1)
-    c=[0]*(n-2)
-    d=[0]*(n-1)
-    M=[0]*(n)
-    M[0]=0
-    M[-1]=0
-    for  i in range(1,n-1):
-        a[i-1]=h[i-1]/6.0
-        b[i]=(h[i-1]+h[i])/3.0
-        c[i-1]=h[i]/6.0
-        d[i-1]=(y[i+1]-y[i])/h[i]-(y[i]-y[i-1])/h[i-1]
-    
-    for i in range(2,n-1):#Forward elimination
+import numpy as np
+
+def _thomas_sweep(a,b,c,d):
+    #Solves along axis 0, any trailing axes are independent systems.
+    #a,c have n-1 rows and b,d have n rows; b and d are overwritten.
+    n=b.shape[0]
+    for i in range(1,n):#Forward elimination
         r=a[i-1]/b[i-1]
-        b[i]-=r*c[i-2]
-        d[i-1]-=r*d[i-2]
-        
-    M[n-2] = d[n-3] / b[n-2] 
-    
-    for i in range(n-3,0,-1):#backward substitution
-        M[i]=(d[i-1]-c[i-1]*M[i+1])/b[i]
-        
-    return M
+        b[i]-=r*c[i-1]
+        d[i]-=r*d[i-1]
+
+    d[n-1]/=b[n-1]
+    for i in range(n-2,-1,-1):#backward substitution
+        d[i]=(d[i]-c[i]*d[i+1])/b[i]
+
+    return d
+
+def thomas_solve(a,b,c,d):
+    d=np.array(d,dtype=float)
+    n=d.shape[0]
+    if len(b)!=n or len(a)!=n-1 or len(c)!=n-1:
+        raise ValueError("expected len(b)==len(d) and len(a)==len(c)==len(d)-1")
+
+    b=np.array(b,dtype=float)
+    a=np.asarray(a,dtype=float)
+    c=np.asarray(c,dtype=float)
+    if d.ndim==2:#several right-hand sides share the same matrix
+        b=np.repeat(b[:,None],d.shape[1],axis=1)
+        a=a[:,None]
+        c=c[:,None]
+
+    return _thomas_sweep(a,b,c,d)
+
+def thomas_factor(a,b,c):
+    #forward elimination on the matrix alone: multipliers r and pivots b'
+    b=np.array(b,dtype=float)
+    a=np.asarray(a,dtype=float)
+    c=np.asarray(c,dtype=float)
+    n=len(b)
+    if len(a)!=n-1 or len(c)!=n-1:
+        raise ValueError("expected len(a)==len(c)==len(b)-1")
+    r=np.empty(n-1)
+    for i in range(1,n):
+        r[i-1]=a[i-1]/b[i-1]
+        b[i]-=r[i-1]*c[i-1]
+    return r,b,c
+
+def thomas_solve_factored(factor,d):
+    r,bp,c=factor
+    d=np.array(d,dtype=float)
+    n=len(bp)
+    if d.shape[0]!=n:
+        raise ValueError("d must have len(b) rows")
+    if d.ndim==2:
+        r=r[:,None]
+        bp=bp[:,None]
+        c=c[:,None]
+    for i in range(1,n):#Forward elimination, right-hand sides only
+        d[i]-=r[i-1]*d[i-1]
+    d[n-1]/=bp[n-1]
+    for i in range(n-2,-1,-1):#backward substitution
+        d[i]=(d[i]-c[i]*d[i+1])/bp[i]
+    return d
+
+def _geometric_filter(e,rho,K):
+    #y[i] = e[i] + rho*y[i-1], truncated after K terms (rho^K < eps)
+    y=e.copy()
+    p=1.0
+    for k in range(1,min(K,len(e))):
+        p*=rho
+        y[k:]+=p*e[:-k]
+    return y
+
+def constant_thomas_solve(a,b,c,d):
+    #a, b, c are scalars: one constant value per diagonal
+    d=np.array(d,dtype=float)
+    n=d.shape[0]
+    disc=b*b-4.0*a*c
+    if n<2 or disc<=0:
+        return thomas_solve(np.full(n-1,a),np.full(n,b),np.full(n-1,c),d)
+    b_inf=(b+np.sign(b)*np.sqrt(disc))/2.0#fixed point of b'=b-a*c/b'
+    with np.errstate(divide="ignore",invalid="ignore"):
+        rho=-a/b_inf
+        sigma=-c/b_inf
+    root=max(abs(rho),abs(sigma))
+    if not root<1.0:#filters do not decay (not diagonally dominant), or NaN
+        return thomas_solve(np.full(n-1,a),np.full(n,b),np.full(n-1,c),d)
+    eps=np.finfo(float).eps
+    K=np.ceil(np.log(eps)/np.log(max(root,1e-300)))+1
+    if not 0<K<=256:#too weakly diagonally dominant, use the plain sweep
+        return thomas_solve(np.full(n-1,a),np.full(n,b),np.full(n-1,c),d)
+    K=int(K)
+
+    #rows whose eliminated diagonal has not yet converged to b_inf
+    bp=[float(b)]
+    while len(bp)<n and abs(bp[-1]-b_inf)>eps*abs(b_inf):
+        bp.append(b-a*c/bp[-1])
+    m=len(bp)
+
+    for i in range(1,m):#Forward elimination, head rows
+        d[i]-=a/bp[i-1]*d[i-1]
+    if m<n:#rest: constant factor, one truncated geometric filter
+        e=d[m:]
+        e[0]+=rho*d[m-1]
+        d[m:]=_geometric_filter(e,rho,K)
+
+    if m<n:#backward substitution, tail rows first
+        g=d[m:]/b_inf
+        d[m:]=_geometric_filter(g[::-1],sigma,K)[::-1]
+        start=m-1
+    else:
+        d[n-1]/=bp[n-1]
+        start=n-2
+    for i in range(start,-1,-1):
+        d[i]=(d[i]-c*d[i+1])/bp[i]
+    return d
+
+def batched_thomas_solve(a,b,c,d):
+    a=np.asarray(a,dtype=float)
+    b=np.asarray(b,dtype=float)
+    c=np.asarray(c,dtype=float)
+    d=np.asarray(d,dtype=float)
+    if d.ndim!=2 or b.shape!=d.shape:
+        raise ValueError("b and d must both have shape (batch, n)")
+    if a.shape!=(d.shape[0],d.shape[1]-1) or c.shape!=a.shape:
+        raise ValueError("a and c must have shape (batch, n-1)")
+
+    #(n, batch) copies keep each elimination step on one contiguous row
+    x=_thomas_sweep(np.ascontiguousarray(a.T),np.array(b.T,order='C'),
+                    np.ascontiguousarray(c.T),np.array(d.T,order='C'))
+    return x.T
+
+def cyclic_thomas_solve(a,b,c,d,alpha,beta):
+    d=np.asarray(d,dtype=float)
+    n=len(d)
+    if n<3:
+        raise ValueError("cyclic tridiagonal systems need at least 3 unknowns")
+
+    #A = T + u v^T with u=[gamma,0,..,0,alpha], v=[1,0,..,0,beta/gamma]
+    b=np.array(b,dtype=float)
+    gamma=-b[0]
+    b[0]-=gamma
+    b[-1]-=alpha*beta/gamma
+
+    rhs=np.zeros((n,2))
+    rhs[:,0]=d
+    rhs[0,1]=gamma
+    rhs[-1,1]=alpha
+    sol=thomas_solve(a,b,c,rhs)
+    y,z=sol[:,0],sol[:,1]
+
+    fact=(y[0]+beta*y[-1]/gamma)/(1.0+z[0]+beta*z[-1]/gamma)
+    return y-fact*z
+
+def thomas_algorithm(x,y,uniform=False):
+    x=np.asarray(x,dtype=float)
+    y=np.asarray(y,dtype=float)
+    n=len(x)
+    M=np.zeros(n)
+    if n<3:
+        return M.tolist()
+
+    h=np.diff(x)
+    d=np.diff(y[1:])/h[1:]-np.diff(y[:-1])/h[:-1]
+    if uniform:
+        #one h for every row: constant diagonals h/6, 2h/3, h/6
+        step=(x[-1]-x[0])/(n-1)
+        M[1:-1]=constant_thomas_solve(step/6.0,2.0*step/3.0,step/6.0,d)
+        return M.tolist()
+    a=h[1:-1]/6.0
+    b=(h[:-1]+h[1:])/3.0
+    c=h[1:-1]/6.0
+
+    M[1:-1]=_thomas_sweep(a,b,c,d)
+    return M.tolist()
+
+def run_constant_checks():
+    #constant_thomas_solve against the plain sweep, including the cases
+    #that must fall back to it (non-dominant, nearly singular)
+    rng=np.random.default_rng(0)
+    d=rng.standard_normal(2000)
+    cases=[(1.0,4.0,1.0),(-1.0,-4.0,-1.0),(1.0,-4.0,2.0),(1.0,4.0,-1.0),
+           (3.5,4.0,1.0),(1.0,4.0,3.5),(2.0,3.0,1.0),(1.0,2.0,1.0),
+           (1.0,2.0+1e-9,1.0),(0.0,2.0,1.0)]
+    for a,b,c in cases:
+        ref=thomas_solve(np.full(len(d)-1,a),np.full(len(d),b),np.full(len(d)-1,c),d)
+        x=constant_thomas_solve(a,b,c,d)
+        err=np.max(np.abs(x-ref))/np.max(np.abs(ref))
+        print(f"a={a:<5g} b={b:<12.10g} c={c:<5g} relative difference {err:.2e}")
+
+if __name__=="__main__":
+    run_constant_checks()
@@ -0,0 +1,6 @@
+"""
+Numerical Differentiation
+-------------------------
+
+Forward, backward and central difference formulas (work in progress).
+"""
@@ -0,0 +1,30 @@
+"""
+Numerical Integration
+---------------------
+
+Trapezoidal and Simpson's rules for definite integrals.
+
+trapezoidal_rule is imported from its module the first time it is used.
+simpsons_rule shares the name of its module, so it is bound when the
+package is imported: a lazy binding would be replaced by the submodule
+as soon as anything ran `import numerical_integration.simpsons_rule`.
+"""
+
+import importlib
+from numerical_integration.simpsons_rule import simpsons_rule
+
+_exports={
+    "trapezoidal_rule":"trapezoid_rule",
+}
+
+__all__=sorted(["simpsons_rule",*_exports])
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value=getattr(importlib.import_module(f"{__name__}.{_exports[name]}"),name)
+    globals()[name]=value#later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals())|set(__all__))
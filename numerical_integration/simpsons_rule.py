@@ -34,5 +34,5 @@ def simpsons_rule(a,b,n,func):
    approx_integral=h/3*(S) 
    return f"approx_integral of the function {func} with boundary {[a,b]} is {approx_integral}"
 #example case
-simpsons_rule(0,1,8,"4/(1+x**(2))")
-  
+if __name__=="__main__":
+    print(simpsons_rule(0,1,8,"4/(1+x**(2))"))
@@ -32,6 +32,7 @@ def trapezoidal_rule(a,b,n,func):
     approx_integral=(h/2)*sum
     return f"approx_integral of the function {func} with boundary {[a,b]} is {approx_integral}"
 #Example case
-print(trapezoidal_rule(0,1,8,"4/(1+x**(2))"))
+if __name__=="__main__":
+    print(trapezoidal_rule(0,1,8,"4/(1+x**(2))"))
 
     
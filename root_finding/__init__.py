@@ -0,0 +1,32 @@
+"""
+Root Finding
+------------
+
+Bisection, Newton-Raphson and secant methods for f(x) = 0.
+
+newtons_method is imported from its module the first time it is used.
+bisection_method and secant_method share the names of their modules,
+so they are bound when the package is imported: a lazy binding would
+be replaced by the submodule as soon as anything ran
+`import root_finding.bisection_method`.
+"""
+
+import importlib
+from root_finding.bisection_method import bisection_method
+from root_finding.secant_method import secant_method
+
+_exports={
+    "newtons_method":"newton_raphson_method",
+}
+
+__all__=sorted(["bisection_method","secant_method",*_exports])
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value=getattr(importlib.import_module(f"{__name__}.{_exports[name]}"),name)
+    globals()[name]=value#later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals())|set(__all__))
@@ -64,31 +64,26 @@ def bisection_method(func,a,b,n=30):
              b=c
        print(f"The root of {func} is {c} in {i} iterations")
 #example cases
-bisection_method("2*(x)**2-7*(x)+6",1.5,2.5,10)
-print()
-bisection_method("x**(2)+x-6",-4,-2,10)
-bisection_method("1 - 2*x*math.exp(-x/2)",0,1,12)
-print()
-bisection_method("5-(x)**(-1)",0.1,1)
-print()
-bisection_method("x**(3)-2*(x)-5",2,3)
-print()
-bisection_method("math.exp(x)-2",0,1)
-print()
-bisection_method("x-math.exp(-x)",0,1)
-print()
-bisection_method("x**(6)-x-1",1,2,)
-print()
-bisection_method("x**(2)-math.sin(x)",0.5,1)
-print()
-bisection_method("x**(3)-2",1,2)
-print()
-bisection_method("x+math.tan(x)",-1,0)
-print()
-#bisection_method("2-((x)**(-1)*math.log(x))",0.33,10)#bisection will not work here,no [-ve,+ve] interval
-
-
-
-
-
-
+if __name__=="__main__":
+    bisection_method("2*(x)**2-7*(x)+6",1.5,2.5,10)
+    print()
+    bisection_method("x**(2)+x-6",-4,-2,10)
+    bisection_method("1 - 2*x*math.exp(-x/2)",0,1,12)
+    print()
+    bisection_method("5-(x)**(-1)",0.1,1)
+    print()
+    bisection_method("x**(3)-2*(x)-5",2,3)
+    print()
+    bisection_method("math.exp(x)-2",0,1)
+    print()
+    bisection_method("x-math.exp(-x)",0,1)
+    print()
+    bisection_method("x**(6)-x-1",1,2,)
+    print()
+    bisection_method("x**(2)-math.sin(x)",0.5,1)
+    print()
+    bisection_method("x**(3)-2",1,2)
+    print()
+    bisection_method("x+math.tan(x)",-1,0)
+    print()
+    #bisection_method("2-((x)**(-1)*math.log(x))",0.33,10)#bisection will not work here,no [-ve,+ve] interval
@@ -55,25 +55,23 @@ What this code does:
     print(f" f(x): {func}\n first derivative :{func_derivative}\n root:{x} \n iteration no: {a}")
    
 #example functions
-newtons_method("1 - 2*x*math.exp(-x/2)","-math.exp(-x/2)*(2 - x)",0,10)
-print()
-newtons_method("5-(x)**(-1)","x**(-2)",0.25,10)
-print()
-newtons_method("x**(3)-2*(x)-5","3*(x)**2-2",2,10)
-print()
-newtons_method("math.exp(x)-2","math.exp(x)",1,10)
-print()
-newtons_method("x-math.exp(-x)","1+math.exp(-x)",1,10)
-print()
-newtons_method("x**(6)-x-1","6*(x)**(5)-1",1,10)
-print()
-newtons_method("x**(2)-math.sin(x)","2*(x)-math.cos(x)",0.5,10)
-print()
-newtons_method("x**(3)-2","3*(x)**2",1,10)
-print()
-newtons_method("x+math.tan(x)","1+1/math.cos(x)**2",3,10)
-print()
-newtons_method("2-((x)**(-1)*math.log(x))","(1-math.log(x))/x**(2)",0.33,10)
-
-
-
+if __name__=="__main__":
+    newtons_method("1 - 2*x*math.exp(-x/2)","-math.exp(-x/2)*(2 - x)",0,10)
+    print()
+    newtons_method("5-(x)**(-1)","x**(-2)",0.25,10)
+    print()
+    newtons_method("x**(3)-2*(x)-5","3*(x)**2-2",2,10)
+    print()
+    newtons_method("math.exp(x)-2","math.exp(x)",1,10)
+    print()
+    newtons_method("x-math.exp(-x)","1+math.exp(-x)",1,10)
+    print()
+    newtons_method("x**(6)-x-1","6*(x)**(5)-1",1,10)
+    print()
+    newtons_method("x**(2)-math.sin(x)","2*(x)-math.cos(x)",0.5,10)
+    print()
+    newtons_method("x**(3)-2","3*(x)**2",1,10)
+    print()
+    newtons_method("x+math.tan(x)","1+1/math.cos(x)**2",3,10)
+    print()
+    newtons_method("2-((x)**(-1)*math.log(x))","(1-math.log(x))/x**(2)",0.33,10)
@@ -28,6 +28,7 @@ def secant_method(xo,xi,n,func):
       
     return f"A root of the function {func} has been found and it has a value of {X1:.4f}"
 #example case
-print(secant_method(3,2,6,"x**(3)-2*(x)-5"))
+if __name__=="__main__":
+    print(secant_method(3,2,6,"x**(3)-2*(x)-5"))
+
 
-            
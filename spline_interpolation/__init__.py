@@ -0,0 +1,53 @@
+"""
+Spline Interpolation
+--------------------
+
+Linear, quadratic and cubic splines through tabulated points, and
+their tensor products on 2-D grids.
+
+Every name below is imported from its module the first time it is
+used, so `import spline_interpolation` itself loads nothing.
+"""
+
+import importlib
+
+_exports={
+    "linear_interpolation":"linear_splines",
+    "quadratic_spline":"quadratic_splines",
+    "quadratic_coefficients":"quadratic_splines",
+    "my_cubic_spline_flat":"cubic_spline_with_thomas_alg",
+    "periodic_thomas_algorithm":"cubic_spline_with_thomas_alg",
+    "cubic_coefficients":"cubic_spline_with_thomas_alg",
+    "PiecewisePolynomial":"splines",
+    "LinearSpline":"splines",
+    "QuadraticSpline":"splines",
+    "CubicSpline":"splines",
+    "IncrementalCubicSpline":"incremental_spline",
+    "CubicSplineBatch":"batched_splines",
+    "batched_thomas_algorithm":"batched_splines",
+    "natural_spline_factor":"batched_splines",
+    "LinearGridSpline":"grid_splines",
+    "CubicGridSpline":"grid_splines",
+    "get_grid_spline":"grid_splines",
+    "bilinear_interpolation":"grid_splines",
+    "bicubic_interpolation":"grid_splines",
+    "clear_grid_cache":"grid_splines",
+    "MappedLinearInterpolator":"mapped_tables",
+    "MappedCubicSpline":"mapped_tables",
+    "open_mapped_table":"mapped_tables",
+    "find_intervals":"piecewise",
+    "is_uniform":"piecewise",
+    "evaluate_piecewise":"piecewise",
+}
+
+__all__=sorted(_exports)
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value=getattr(importlib.import_module(f"{__name__}.{_exports[name]}"),name)
+    globals()[name]=value#later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals())|set(__all__))
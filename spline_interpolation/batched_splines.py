@@ -0,0 +1,163 @@
+"""
+======================================================================
+Batched Natural Cubic Splines on Shared Knots
+----------------------------------------------------------------------
+
+Overview:
+---------
+Fitting thousands of curves that share one x grid with
+thomas_algorithm(x, y) repeats the same forward elimination for every
+curve, because the tridiagonal matrix
+
+    h(i-1)/6 M(i-1) + (h(i-1)+h(i))/3 M(i) + h(i)/6 M(i+1) = s(i) - s(i-1)
+
+only depends on x. Only the right-hand side depends on y. So this
+module:
+
+1. Factors the matrix once per knot vector (thomas_factor), or uses
+   constant_thomas_solve when the knots are declared evenly spaced
+   (uniform=True).
+2. Builds the right-hand sides of all curves as one (n-2, curves)
+   array and solves them in one sweep (thomas_solve_factored), each
+   step vectorized across the curves.
+3. Converts every curve's M values into power-basis coefficients,
+   stored as one (4, curves, n-1) array.
+4. Evaluates all curves at the same queries: the segments of the
+   queries are looked up once (they are the same for every curve) and
+   Horner's rule runs on (curves, chunk) blocks.
+
+Functions():
+----------------
+1. natural_spline_factor(x):
+    Factorization of the natural spline matrix of the knots x (None
+    for fewer than 3 knots, which have nothing to solve).
+
+2. batched_thomas_algorithm(x, Y, factor=None, uniform=False):
+    Second derivatives M, shape (curves, n), of the natural splines
+    through every row of Y. Pass factor to skip the factorization, or
+    uniform=True to use constant_thomas_solve for evenly spaced x.
+
+Class():
+----------------
+CubicSplineBatch(x, Y, extrapolate=False, uniform=None):
+    Y has shape (curves, n), one curve per row.
+    - spline(X)      -> array of shape (curves, len(X))
+    - spline.refit(Y) re-solves for new curves on the same knots,
+                      reusing the factorization
+    - spline.M       second derivatives, shape (curves, n)
+    - spline.c       coefficients, shape (4, curves, n-1)
+
+Notes:
+------
+- Natural boundary conditions (M = 0 at both ends), the same curves
+  as my_cubic_spline_flat(x, y, X) row by row.
+- Queries are processed in chunks so the (curves, chunk) temporaries
+  stay bounded for long query arrays.
+
+======================================================================
+"""
+
+
+import numpy as np
+from linear_algebra.thomas_algorithm import thomas_factor,thomas_solve_factored,constant_thomas_solve
+from spline_interpolation.piecewise import find_intervals,is_uniform
+
+_BLOCK=1<<18#curves*queries per Horner block
+
+def natural_spline_factor(x):
+    #factored natural spline matrix of the knots, None when there is
+    #nothing to factor (n < 3)
+    x=np.asarray(x,dtype=float)
+    if len(x)<3:
+        return None
+    h=np.diff(x)
+    return thomas_factor(h[1:-1]/6.0,(h[:-1]+h[1:])/3.0,h[1:-1]/6.0)
+
+def batched_thomas_algorithm(x,Y,factor=None,uniform=False):
+    #second derivatives M (curves, n) of the natural splines through the rows of Y
+    x=np.asarray(x,dtype=float)
+    Y=np.asarray(Y,dtype=float)
+    n=len(x)
+    h=np.diff(x)
+    M=np.zeros(Y.shape)
+    if n<3:
+        return M
+    s=np.diff(Y,axis=1)/h
+    rhs=np.ascontiguousarray((s[:,1:]-s[:,:-1]).T)#(n-2, curves)
+    if uniform:
+        step=(x[-1]-x[0])/(n-1)
+        M[:,1:-1]=constant_thomas_solve(step/6.0,2.0*step/3.0,step/6.0,rhs).T
+    else:
+        if factor is None:
+            factor=natural_spline_factor(x)
+        M[:,1:-1]=thomas_solve_factored(factor,rhs).T
+    return M
+
+class CubicSplineBatch:
+    def __init__(self,x,Y,extrapolate=False,uniform=None):
+        self.x=np.ascontiguousarray(x,dtype=float)
+        n=len(self.x)
+        if n<2 or np.any(np.diff(self.x)<=0):
+            raise ValueError("x must be strictly increasing with at least two knots")
+        self.extrapolate=extrapolate
+        #detected spacing only picks the lookup; the constant solve is opt-in
+        self.uniform=is_uniform(self.x) if uniform is None else bool(uniform)
+        self._constant=uniform is True
+        self.h=np.diff(self.x)
+        self._factor=None if self._constant else natural_spline_factor(self.x)
+        self.refit(Y)
+
+    def refit(self,Y):
+        Y=np.asarray(Y,dtype=float)
+        if Y.ndim==1:
+            Y=Y[None,:]
+        if Y.ndim!=2 or Y.shape[1]!=len(self.x):
+            raise ValueError("Y must have shape (curves, len(x))")
+        h=self.h
+        s=np.diff(Y,axis=1)/h#slopes, (curves, n-1)
+        M=batched_thomas_algorithm(self.x,Y,self._factor,self._constant)
+
+        self.Y=Y
+        self.M=M
+        self.c=np.stack([np.diff(M,axis=1)/(6*h),
+                         M[:,:-1]/2,
+                         s-h*(2*M[:,:-1]+M[:,1:])/6,
+                         Y[:,:-1]])
+        return self
+
+    @property
+    def curves(self):
+        return self.c.shape[1]
+
+    def __call__(self,X,extrapolate=None):
+        if extrapolate is None:
+            extrapolate=self.extrapolate
+        X=np.asarray(X,dtype=float).ravel()
+        i=find_intervals(self.x,X,extrapolate,uniform=self.uniform)
+        t=X-self.x[i]
+
+        out=np.empty((self.curves,len(X)))
+        step=max(1,_BLOCK//max(self.curves,1))
+        for s in range(0,len(X),step):
+            idx=i[s:s+step]
+            ts=t[s:s+step]
+            block=out[:,s:s+step]
+            block[...]=self.c[0][:,idx]
+            for row in self.c[1:]:
+                block*=ts
+                block+=row[:,idx]
+        return out
+
+def run_batched_splines():
+    rng=np.random.default_rng(0)
+    x=np.sort(rng.uniform(0,10,200))
+    phase=rng.uniform(0,2*np.pi,5000)
+    Y=np.sin(x[None,:]+phase[:,None])
+    batch=CubicSplineBatch(x,Y)
+    X=np.linspace(x[0],x[-1],1000)
+    S=batch(X)
+    print(f"curves x queries : {S.shape}")
+    print(f"max |S - sin|     : {np.max(np.abs(S-np.sin(X[None,:]+phase[:,None]))):.2e}")
+
+if __name__=="__main__":
+    run_batched_splines()
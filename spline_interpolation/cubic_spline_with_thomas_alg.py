@@ -23,20 +23,43 @@ Functions():
    - Constructs and solves the tridiagonal system to compute 
      second derivatives of the spline.
    - Returns the list of M values (curvature at each x).
+   - Imported from linear_algebra/thomas_algorithm.py together with
+     cyclic_thomas_solve, so there is one copy of each solver.
 
-2. my_cubic_spline_flat(x, y, X):
+2. periodic_thomas_algorithm(x, y):
+   - Same as thomas_algorithm but for periodic data (y[0] == y[-1]).
+   - The periodic system is cyclic tridiagonal; it is solved in O(n)
+     with a Sherman-Morrison correction on top of the Thomas sweep
+     (cyclic_thomas_solve) instead of a dense LU.
+
+3. cubic_coefficients(x, y, M):
+   - Converts the M values into per-segment coefficients
+     S = d*t^3 + c*t^2 + b*t + a with t = X - x_i, returned as one
+     (4, n-1) array.
+
+4. my_cubic_spline_flat(x, y, X, boundary="natural", extrapolate=False):
    - Takes known data points `(x, y)` and query points `X`
    - Uses cubic spline interpolation to compute interpolated values `Y`
-
-3. visualize_data(x, y, X, Y):
+     (a NumPy array shaped like X)
+   - boundary="periodic" makes the spline wrap around smoothly
+     (matching value, slope and curvature at both ends)
+   - extrapolate=True extends the end segments past the data instead
+     of raising ValueError
+   - Segment lookup and evaluation are vectorized over all of X
+     (see piecewise.py), sorted X takes an O(n+m) merge path
+   - Evenly spaced x (detected, or uniform=True) finds segments by
+     arithmetic; uniform=True also solves the constant-diagonal system
+     with constant_thomas_solve (detected spacing keeps the exact sweep)
+
+5. visualize_data(x, y, X, Y):
    - Plots the original data points and the smooth spline curve
 
-4. test_case():
+6. test_case():
    - Defines a sample dataset
    - Interpolates values on a fine interval using the spline
    - Visualizes the result and returns interpolated `Y`
 
-5. main():
+7. main():
    - Entry point that runs the full test and displays output
 
 You'll see a smooth red curve passing through black circular data points, 
@@ -44,8 +67,9 @@ representing the cubic spline interpolation.
 
 Notes:
 ------
-- This implementation uses **natural boundary conditions**, meaning:
+- This implementation uses **natural boundary conditions** by default, meaning:
       M₀ = Mₙ = 0
+- Periodic boundary conditions instead use M₀ = Mₙ and S'(x₀) = S'(xₙ)
 - The Thomas algorithm is used for efficient solving of the tridiagonal system.
 - The method is ideal for smoothly interpolating physical or tabulated data
   (e.g., engineering or physics applications).
@@ -56,61 +80,51 @@ Notes:
 
 
 import numpy as np
-import matplotlib.pyplot as plt
-def thomas_algorithm(x,y):
+from linear_algebra.thomas_algorithm import thomas_algorithm,cyclic_thomas_solve
+from spline_interpolation.piecewise import evaluate_piecewise
+
+def periodic_thomas_algorithm(x,y):
     n=len(x)
-    h=[x[i+1]-x[i] for i in range(n-1)]
-    a=[0]*(n-2)
-    b=[0]*(n-1)
-    c=[0]*(n-2)
-    d=[0]*(n-1)
-    M=[0]*(n)
-    M[0]=0
-    M[-1]=0
-    for  i in range(1,n-1):
-        a[i-1]=h[i-1]/6.0
-        b[i]=(h[i-1]+h[i])/3.0
-        c[i-1]=h[i]/6.0
-        d[i-1]=(y[i+1]-y[i])/h[i]-(y[i]-y[i-1])/h[i-1]
+    if n<4:
+        raise ValueError("periodic spline needs at least 4 points")
+    if y[0]!=y[-1]:
+        raise ValueError("periodic spline needs y[0] == y[-1]")
     
-    for i in range(2,n-1):#Forward elimination
-        r=a[i-1]/b[i-1]
-        b[i]-=r*c[i-2]
-        d[i-1]-=r*d[i-2]
-        
-    M[n-2] = d[n-3] / b[n-2] 
+    #unknowns M[0..n-2], M[n-1] is the same point as M[0]
+    h=np.diff(np.asarray(x,dtype=float))
+    s=np.diff(np.asarray(y,dtype=float))/h
+    a=h[:-1]/6.0
+    b=(np.roll(h,1)+h)/3.0
+    c=h[:-1]/6.0
+    d=s-np.roll(s,1)
     
-    for i in range(n-3,0,-1):#backward substitution
-        M[i]=(d[i-1]-c[i-1]*M[i+1])/b[i]
-        
-    return M
-
-def my_cubic_spline_flat(x,y,X):
-   M=thomas_algorithm(x,y)
-   n=len(x)
-   h=[x[i+1]-x[i] for i in range(n-1)]
-   
-   Y=[]
-   for query in X:
-      if  query< x[0] or query>x[-1]:
-         raise ValueError("x_query is out of interpolation range")
-   
-   for query in X:
-     for i in range(n-1):
-        if query>=x[i] and  query<=x[i+1]:
-                A = x[i+1] - query
-                B = query - x[i]
-                S = (M[i] * A**3 + M[i+1] * B**3) /(6 * h[i]) \
-                    + (y[i] / h[i] - (M[i] * h[i]) / 6) * A \
-                      + (y[i+1] / h[i] - (M[i+1] * h[i]) / 6) * B
-                Y.append(S)
-                break
-     else:
-            raise ValueError("no interval found for x_query")
-     
-   return Y
+    M=cyclic_thomas_solve(a,b,c,d,h[-1]/6.0,h[-1]/6.0)
+    return list(M)+[M[0]]
+
+def cubic_coefficients(x,y,M):
+   #power-basis coefficients of every segment, t = X - x[i]:
+   #S = d*t^3 + c*t^2 + b*t + a
+   x=np.asarray(x,dtype=float)
+   y=np.asarray(y,dtype=float)
+   M=np.asarray(M,dtype=float)
+   h=np.diff(x)
+   a=y[:-1]
+   b=np.diff(y)/h-h*(2*M[:-1]+M[1:])/6
+   c=M[:-1]/2
+   d=np.diff(M)/(6*h)
+   return np.vstack([d,c,b,a])
+
+def my_cubic_spline_flat(x,y,X,boundary="natural",extrapolate=False,uniform=None):
+   if boundary=="natural":
+      M=thomas_algorithm(x,y,uniform is True)
+   elif boundary=="periodic":
+      M=periodic_thomas_algorithm(x,y)
+   else:
+      raise ValueError("boundary must be 'natural' or 'periodic'")
+   return evaluate_piecewise(x,cubic_coefficients(x,y,M),X,extrapolate,uniform=uniform)
 
 def visualize_data(x,y,X,Y):
+    import matplotlib.pyplot as plt
     plt.plot(x,y,'ko',label='Data points')
     plt.plot(X,Y,'r-',label="cubic spline")
     plt.title("cubic spline interpolation")
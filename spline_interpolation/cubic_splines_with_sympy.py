@@ -1,9 +1,11 @@
 """
 Natural Cubic Spline Interpolation in Python 
 
-This script builds a natural cubic spline interpolator from scratch using SymPy.
-It's a symbolic (non-numeric) implementation, meaning it builds and solves the
-system of equations for the spline coefficients exactly — no matrix libraries needed.
+This script builds a natural cubic spline interpolator from scratch. By default
+the coefficient equations are built numerically and reduced to one tridiagonal
+system, solved in O(n) with thomas_solve. my_cubic_spline_flat(x, y, X, exact=True)
+keeps the original symbolic implementation: it builds and solves the system of
+equations for the spline coefficients with SymPy (seconds for 15 points).
 
 
  What does it do?
@@ -25,7 +27,13 @@ Then we generate equations to make sure:
 - The first and second derivatives match at the joins.
 - The spline is "natural", meaning its second derivative is zero at the first and last x.
 
-All equations are symbolically solved using sympy.solve().
+With exact=True all equations are symbolically solved using sympy.solve().
+Otherwise aᵢ = yᵢ and the remaining conditions reduce to
+
+    hᵢ₋₁cᵢ₋₁ + 2(hᵢ₋₁ + hᵢ)cᵢ + hᵢcᵢ₊₁ = 3(sᵢ - sᵢ₋₁),   c₀ = cₙ = 0
+    bᵢ = sᵢ - hᵢ(2cᵢ + cᵢ₊₁)/3,   dᵢ = (cᵢ₊₁ - cᵢ)/(3hᵢ)
+
+where sᵢ is the slope of interval i.
 
 
 How to use:
@@ -35,21 +43,23 @@ How to use:
 - Call my_cubic_spline_flat(x, y, X) to get interpolated y-values
 - Use visualize_data(x, y, X, Y) to plot everything
 
-You can run the script directly — it includes a test_case() to show how it works.
+You can run it from the repository root with
+python -m spline_interpolation.cubic_splines_with_sympy — it includes a
+test_case() to show how it works.
 
 Requirements:
-- sympy
-- matplotlib
 - numpy
+- sympy (only for exact=True)
+- matplotlib (only for visualize_data)
 
 Install them using:
     pip install sympy matplotlib numpy
 """
-from sympy import Eq,solve,symbols
 import numpy as np
-import matplotlib.pyplot as plt
-from sympy import Rational
-def my_cubic_spline_flat(x,y,X):
+from linear_algebra.thomas_algorithm import thomas_solve
+from spline_interpolation.piecewise import evaluate_piecewise
+def _cubic_spline_exact(x,y,X):
+    from sympy import Eq,solve,symbols#loaded only for exact=True
     n=len(x)-1
     a = symbols(f'a0:{n}') 
     b=symbols(f"b0:{n}")    #bo,b1,...,bn-1
@@ -101,7 +111,27 @@ def my_cubic_spline_flat(x,y,X):
          raise ValueError("interpolation interval was not found for x_query")
     return Y
 
+def natural_cubic_coefficients(x,y):
+    #same equations as the symbolic system, reduced to one tridiagonal system in c:
+    #h(i-1)*c(i-1) + 2*(h(i-1)+h(i))*c(i) + h(i)*c(i+1) = 3*(s(i)-s(i-1)),  c0 = cn = 0
+    x=np.asarray(x,dtype=float)
+    y=np.asarray(y,dtype=float)
+    h=np.diff(x)
+    s=np.diff(y)/h
+    c=np.zeros(len(x))
+    if len(x)>2:
+        c[1:-1]=thomas_solve(h[1:-1],2*(h[:-1]+h[1:]),h[1:-1],3*np.diff(s))
+    b=s-h*(2*c[:-1]+c[1:])/3
+    d=np.diff(c)/(3*h)
+    return np.vstack([d,c[:-1],b,y[:-1]])
+
+def my_cubic_spline_flat(x,y,X,exact=False,extrapolate=False):
+    if exact:
+        return _cubic_spline_exact(x,y,X)
+    return evaluate_piecewise(x,natural_cubic_coefficients(x,y),X,extrapolate)
+
 def visualize_data(x,y,X,Y):
+    import matplotlib.pyplot as plt
     plt.plot(x,y,'ko',label='Data points')
     plt.plot(X,Y,'r-',label="cubic spline")
     plt.title("cubic spline interpolation")
@@ -0,0 +1,225 @@
+"""
+======================================================================
+Tensor-Product Splines on Rectilinear 2-D Grids
+----------------------------------------------------------------------
+
+Overview:
+---------
+A lookup table is a surface sampled on a rectilinear grid:
+
+    Z[i, j] = f(x[i], y[j])      x: (nx,), y: (ny,), both increasing
+
+(the spacing may differ from row to row and column to column). The
+interpolants here are tensor products of the 1-D splines in this
+folder, so along every grid line they are exactly the 1-D spline of
+that line.
+
+Linear (bilinear):
+    Inside the cell [x_i, x_(i+1)] x [y_j, y_(j+1)], with
+    u = (X - x_i)/hx and v = (Y - y_j)/hy,
+
+        S = (1-u)(1-v) Z[i,j] + u(1-v) Z[i+1,j] + (1-u)v Z[i,j+1] + uv Z[i+1,j+1]
+
+Cubic (bicubic natural spline):
+    The 1-D natural spline on a segment, written with the values and
+    second derivatives M at its two ends, is
+
+        S(X) = A y_i + B y_(i+1) + C M_i + D M_(i+1)
+        A = (x_(i+1) - X)/h,  B = 1 - A,  C = (A^3 - A) h^2/6,  D = (B^3 - B) h^2/6
+
+    The tensor product applies this in x and in y, so every grid node
+    needs four numbers: Z, Zxx, Zyy and Zxxyy (second derivatives of
+    the x splines, the y splines, and the y splines of Zxx). They come
+    from three batched natural spline solves (batched_thomas_algorithm,
+    one factorization per axis, all grid lines of that axis in one
+    sweep):
+
+        Zxx   : splines along x, one per column j
+        Zyy   : splines along y, one per row i
+        Zxxyy : splines along y of Zxx
+
+    The four numbers of a node are stored side by side, so each query
+    reads its cell with four gathers of four contiguous floats.
+
+Evaluation:
+-----------
+Queries are scattered (X, Y) pairs. The cell of every query is found
+with find_intervals on each axis (arithmetic on evenly spaced axes,
+binary search otherwise) and the formula above runs over chunks of
+queries with NumPy, so there is no Python loop over points.
+
+Coefficient cache:
+------------------
+bilinear_interpolation() and bicubic_interpolation() fit and evaluate
+in one call. To avoid refitting the same table on every call, the
+fitted object is kept in a module-level LRU cache keyed by a hash of
+the table (x, y and Z bytes), like the FFT plan cache in
+fast_fourier_transforms.py. get_grid_spline() returns the cached
+object, clear_grid_cache() empties it.
+
+Functions():
+----------------
+1. LinearGridSpline(x, y, Z, extrapolate=False) / CubicGridSpline(...):
+    Fitted interpolants; spline(X, Y) evaluates at scattered points
+    (X and Y broadcast against each other, the result has their shape).
+
+2. get_grid_spline(x, y, Z, kind="cubic", extrapolate=False):
+    Cached fitted interpolant of the table, kind "linear" or "cubic".
+
+3. bilinear_interpolation(x, y, Z, X, Y, extrapolate=False)
+   bicubic_interpolation(x, y, Z, X, Y, extrapolate=False):
+    One-call interpolation through the cache.
+
+4. clear_grid_cache():
+    Drops every cached table.
+
+Notes:
+------
+- Z must have shape (len(x), len(y)), i.e. Z[i, j] belongs to x[i], y[j]
+  (np.meshgrid(x, y, indexing="ij") order).
+- Queries outside the grid raise ValueError unless extrapolate=True,
+  in which case the edge cells are continued.
+- The cache holds at most _CACHE_SIZE tables; a table modified in place
+  hashes differently, so it is refitted rather than served stale.
+
+======================================================================
+"""
+
+
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from spline_interpolation.piecewise import find_intervals,is_uniform
+from spline_interpolation.batched_splines import batched_thomas_algorithm,natural_spline_factor
+
+_CHUNK=1<<16#queries per evaluation pass
+_CACHE_SIZE=16#fitted tables kept by get_grid_spline
+
+class _GridSpline:
+    def __init__(self,x,y,Z,extrapolate=False):
+        self.x=np.ascontiguousarray(x,dtype=float)
+        self.y=np.ascontiguousarray(y,dtype=float)
+        Z=np.asarray(Z,dtype=float)
+        for name,axis in (("x",self.x),("y",self.y)):
+            if axis.ndim!=1 or len(axis)<2 or np.any(np.diff(axis)<=0):
+                raise ValueError(f"{name} must be strictly increasing with at least two points")
+        if Z.shape!=(len(self.x),len(self.y)):
+            raise ValueError("Z must have shape (len(x), len(y))")
+        self.extrapolate=bool(extrapolate)
+        self.uniform=(is_uniform(self.x),is_uniform(self.y))
+        self.shape=Z.shape
+
+    def _cells(self,X,Y,extrapolate):
+        i=find_intervals(self.x,X,extrapolate,uniform=self.uniform[0])
+        j=find_intervals(self.y,Y,extrapolate,uniform=self.uniform[1])
+        hx=self.x[i+1]-self.x[i]
+        hy=self.y[j+1]-self.y[j]
+        u=(X-self.x[i])/hx
+        v=(Y-self.y[j])/hy
+        return i*self.shape[1]+j,u,v,hx,hy
+
+    def __call__(self,X,Y,extrapolate=None):
+        if extrapolate is None:
+            extrapolate=self.extrapolate
+        X,Y=np.broadcast_arrays(np.asarray(X,dtype=float),np.asarray(Y,dtype=float))
+        shape=X.shape
+        X=X.ravel()
+        Y=Y.ravel()
+        S=np.empty(len(X))
+        for s in range(0,len(X),_CHUNK):
+            S[s:s+_CHUNK]=self._evaluate(*self._cells(X[s:s+_CHUNK],Y[s:s+_CHUNK],extrapolate))
+        return S.reshape(shape)
+
+    @property
+    def nbytes(self):
+        return self.x.nbytes+self.y.nbytes+self.table.nbytes
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(grid={self.shape[0]}x{self.shape[1]}, "
+                f"x=[{self.x[0]:g}, {self.x[-1]:g}], y=[{self.y[0]:g}, {self.y[-1]:g}])")
+
+class LinearGridSpline(_GridSpline):
+    def __init__(self,x,y,Z,extrapolate=False):
+        super().__init__(x,y,Z,extrapolate)
+        self.table=np.ascontiguousarray(Z,dtype=float).ravel()
+
+    def _evaluate(self,k,u,v,hx,hy):
+        ny=self.shape[1]
+        Z=self.table
+        return ((1-u)*((1-v)*Z[k]+v*Z[k+1])
+                +u*((1-v)*Z[k+ny]+v*Z[k+ny+1]))
+
+class CubicGridSpline(_GridSpline):
+    def __init__(self,x,y,Z,extrapolate=False):
+        super().__init__(x,y,Z,extrapolate)
+        Z=np.asarray(Z,dtype=float)
+        fy=natural_spline_factor(self.y)#shared by the Zyy and Zxxyy solves
+        Zxx=batched_thomas_algorithm(self.x,Z.T).T
+        Zyy=batched_thomas_algorithm(self.y,Z,fy)
+        Zxxyy=batched_thomas_algorithm(self.y,Zxx,fy)
+        #one row of 4 floats per node: Z, Zxx, Zyy, Zxxyy
+        self.table=np.stack([Z,Zxx,Zyy,Zxxyy],axis=-1).reshape(-1,4)
+
+    def _evaluate(self,k,u,v,hx,hy):
+        ny=self.shape[1]
+        #A, B weigh the values, C, D the second derivatives (see Overview)
+        ax=(1-u,u)
+        cx=(((1-u)**3-(1-u))*hx*hx/6,(u**3-u)*hx*hx/6)
+        ay=(1-v,v)
+        cy=(((1-v)**3-(1-v))*hy*hy/6,(v**3-v)*hy*hy/6)
+        S=np.zeros(len(k))
+        for di in (0,1):
+            for dj in (0,1):
+                node=self.table[k+di*ny+dj]#(m, 4)
+                S+=ay[dj]*(ax[di]*node[:,0]+cx[di]*node[:,1])
+                S+=cy[dj]*(ax[di]*node[:,2]+cx[di]*node[:,3])
+        return S
+
+_kinds={"linear":LinearGridSpline,"cubic":CubicGridSpline}
+_cache=OrderedDict()
+
+def _table_key(x,y,Z,kind,extrapolate):
+    digest=hashlib.blake2b(digest_size=16)
+    for a in (x,y,Z):
+        a=np.ascontiguousarray(a,dtype=float)
+        digest.update(repr(a.shape).encode())
+        digest.update(a.data)
+    return (kind,bool(extrapolate),digest.hexdigest())
+
+def get_grid_spline(x,y,Z,kind="cubic",extrapolate=False):
+    if kind not in _kinds:
+        raise ValueError("kind must be 'linear' or 'cubic'")
+    key=_table_key(x,y,Z,kind,extrapolate)
+    spline=_cache.get(key)
+    if spline is None:
+        spline=_kinds[kind](x,y,Z,extrapolate)
+        _cache[key]=spline
+        if len(_cache)>_CACHE_SIZE:
+            _cache.popitem(last=False)#least recently used
+    else:
+        _cache.move_to_end(key)
+    return spline
+
+def clear_grid_cache():
+    _cache.clear()
+
+def bilinear_interpolation(x,y,Z,X,Y,extrapolate=False):
+    return get_grid_spline(x,y,Z,"linear",extrapolate)(X,Y)
+
+def bicubic_interpolation(x,y,Z,X,Y,extrapolate=False):
+    return get_grid_spline(x,y,Z,"cubic",extrapolate)(X,Y)
+
+def run_grid_splines():
+    x=np.linspace(0.0,3.0,61)
+    y=np.sort(np.random.default_rng(0).uniform(-2.0,2.0,80))
+    f=lambda X,Y: np.sin(X)*np.cos(Y)+0.1*X*Y
+    Z=f(*np.meshgrid(x,y,indexing="ij"))
+    rng=np.random.default_rng(1)
+    X=rng.uniform(x[0],x[-1],1_000_000)
+    Y=rng.uniform(y[0],y[-1],1_000_000)
+    for kind in ("linear","cubic"):
+        s=get_grid_spline(x,y,Z,kind)
+        print(f"{s!r:<55} max error: {np.max(np.abs(s(X,Y)-f(X,Y))):.2e}")
+
+if __name__=="__main__":
+    run_grid_splines()
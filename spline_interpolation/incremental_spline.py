@@ -0,0 +1,193 @@
+"""
+======================================================================
+Incremental (Streaming) Natural Cubic Spline
+----------------------------------------------------------------------
+
+Overview:
+---------
+thomas_algorithm(x, y) rebuilds and re-solves the whole natural spline
+system, so refitting after every new sample of a stream costs O(n)
+per sample. Appending one point only touches the end of the system:
+
+    row i:  h(i-1)/6 M(i-1) + (h(i-1)+h(i))/3 M(i) + h(i)/6 M(i+1) = s(i) - s(i-1)
+
+1. Forward elimination runs top-down and row i only depends on the
+   rows above it, so the eliminated diagonal b'(i) and right-hand side
+   d'(i) of the old rows never change. A new point adds one row and
+   eliminates it against the previous one: O(1).
+2. Back substitution starts again at the new last row (M = 0 moves
+   from the old last point to the new one). The change it causes
+   shrinks by a factor of about h/(6 b') ~ 0.27 per row going back,
+   so it is stopped once the update drops below `tol`: a few dozen
+   rows at most, independent of n.
+
+So every append is amortized O(1), and the M values stay within `tol`
+of a from-scratch thomas_algorithm(x, y) solution.
+
+Sliding window:
+---------------
+With window=W only the newest W points are kept, in an array of 2W
+slots that is compacted (one copy of W entries) every W appends, so
+memory is bounded and the copy is still O(1) per sample. The curve on
+the window is the natural spline of the whole stream restricted to
+the window (its left end is not forced to M = 0); the eliminated
+state carries the history.
+
+Class():
+----------------
+IncrementalCubicSpline(window=None, tol=1e-12):
+    append(x, y)        add one sample (x must keep increasing)
+    extend(xs, ys)      add many samples
+    spline(X)           evaluate over the current window
+    to_spline()         CubicSpline-style PiecewisePolynomial snapshot
+    x, y, M             views of the current window
+
+Notes:
+------
+- tol is relative to the largest |M| seen so far.
+- Evaluation coefficients are rebuilt lazily after appends, so a burst
+  of appends followed by one query pays for one O(W) rebuild.
+
+======================================================================
+"""
+
+
+import numpy as np
+from spline_interpolation.piecewise import evaluate_piecewise
+from spline_interpolation.cubic_spline_with_thomas_alg import cubic_coefficients
+
+class IncrementalCubicSpline:
+    def __init__(self,window=None,tol=1e-12):
+        if window is not None and window<3:
+            raise ValueError("window must hold at least 3 points")
+        self.window=window
+        self.tol=tol
+        cap=2*window if window else 64
+        self._x=np.empty(cap)
+        self._y=np.empty(cap)
+        self._bp=np.empty(cap)#eliminated diagonal b'(i) of row i
+        self._dp=np.empty(cap)#eliminated right-hand side d'(i)
+        self._M=np.empty(cap)
+        self._start=0
+        self._end=0
+        self._first=0#stream index of the point stored at _start
+        self._m_scale=0.0
+        self._coeffs=None
+
+    def _lo(self):
+        #the buffer holds up to 2W points, only the newest W are exposed
+        if self.window:
+            return max(self._start,self._end-self.window)
+        return self._start
+
+    def __len__(self):
+        return self._end-self._lo()
+
+    @property
+    def x(self):
+        return self._x[self._lo():self._end]
+
+    @property
+    def y(self):
+        return self._y[self._lo():self._end]
+
+    @property
+    def M(self):
+        return self._M[self._lo():self._end]
+
+    def _make_room(self):
+        if self._end<len(self._x):
+            return
+        if self.window:
+            #keep the newest window-1 points at the front
+            keep=self.window-1
+            s=self._end-keep
+            for arr in (self._x,self._y,self._bp,self._dp,self._M):
+                arr[:keep]=arr[s:self._end]
+            self._first+=s-self._start
+            self._start=0
+            self._end=keep
+        else:
+            for name in ("_x","_y","_bp","_dp","_M"):
+                old=getattr(self,name)
+                new=np.empty(2*len(old))
+                new[:self._end]=old[:self._end]
+                setattr(self,name,new)
+
+    def append(self,x,y):
+        x=float(x)
+        y=float(y)
+        if self._end>self._start and x<=self._x[self._end-1]:
+            raise ValueError("x must be strictly increasing")
+        self._make_room()
+        i=self._end
+        X,Y,bp,dp,M=self._x,self._y,self._bp,self._dp,self._M
+        X[i]=x
+        Y[i]=y
+        M[i]=0.0#natural end condition at the newest point
+        self._end+=1
+        self._coeffs=None
+        if self._first+self._end-self._start<3:
+            return
+
+        #new interior row j=i-1 couples M(i-2), M(i-1), M(i)
+        j=i-1
+        h0=X[j]-X[j-1]
+        h1=X[i]-X[j]
+        b=(h0+h1)/3.0
+        d=(Y[i]-Y[j])/h1-(Y[j]-Y[j-1])/h0
+        if self._has_row(j-1):
+            r=(h0/6.0)/bp[j-1]
+            b-=r*h0/6.0
+            d-=r*dp[j-1]
+        bp[j]=b
+        dp[j]=d
+
+        #back substitution from the new last row until the update dies out
+        M[j]=d/b
+        self._m_scale=max(self._m_scale,abs(M[j]))
+        atol=self.tol*max(self._m_scale,1e-300)
+        k=j-1
+        while k>=self._start and self._has_row(k):
+            new=(dp[k]-(X[k+1]-X[k])/6.0*M[k+1])/bp[k]
+            delta=abs(new-M[k])
+            M[k]=new
+            if delta<=atol:
+                break
+            k-=1
+
+    def _has_row(self,k):
+        #every point except the first of the stream and the newest one is an unknown
+        return self._first+k-self._start>=1
+
+    def extend(self,xs,ys):
+        for x,y in zip(xs,ys):
+            self.append(x,y)
+
+    def _coefficients(self):
+        if self._coeffs is None:
+            self._coeffs=cubic_coefficients(self.x,self.y,self.M)
+        return self._coeffs
+
+    def __call__(self,X,extrapolate=False):
+        if len(self)<2:
+            raise ValueError("need at least two points")
+        return evaluate_piecewise(self.x,self._coefficients(),X,extrapolate)
+
+    def to_spline(self,extrapolate=False):
+        from spline_interpolation.splines import PiecewisePolynomial
+        return PiecewisePolynomial(self.x.copy(),self._coefficients().copy(),extrapolate)
+
+def run_incremental_spline():
+    rng=np.random.default_rng(0)
+    s=IncrementalCubicSpline(window=1000)
+    t=0.0
+    for _ in range(100_000):
+        t+=0.05+0.05*rng.random()
+        s.append(t,np.sin(t))
+    X=np.linspace(s.x[10],s.x[-1],5)
+    print(f"points kept : {len(s)} of 100000")
+    print(f"max |S - sin| in window: {np.max(np.abs(s(X)-np.sin(X))):.2e}")
+
+if __name__=="__main__":
+    run_incremental_spline()
@@ -1,5 +1,5 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from spline_interpolation.piecewise import evaluate_piecewise
 """
 Linear Spline Interpolation 
 Concept:
@@ -28,6 +28,13 @@ Variables:
 
 Supports:
 - single or multiple queries: e.g., x_query =[2, 5,4..]
+- extrapolate=True continues the first/last line outside [x0, xn]
+  (otherwise a ValueError is raised)
+- all queries are handled at once: interval lookup is a binary search
+  (or an O(n+m) merge when x_query is sorted) and the line formula is
+  applied with NumPy, see piecewise.py. The result is a NumPy array.
+- evenly spaced x is detected (or declared with uniform=True) and the
+  interval is then found arithmetically in O(1) per query
 
 visualization:
 Includes a visualize() function to plot:
@@ -39,29 +46,15 @@ I Designed it to be clear, educational, and easy to modify.
 
     """
 
-def linear_interpolation(x,y,x_query):
-  y_result=[]
-  n=len(x)
-  for query in x_query:
-    if query<x[0] or query>x[-1]:
-        raise ValueError("x_query is out of the interpolation range")
-    
-    for i in range(n-1):
-        xo=x[i]
-        x1=x[i+1]
-        if query>=xo and query<=x1:
-          yo=y[i]
-          y1=y[i+1]
-       
-          m=(y1-yo)/(x1-xo)
-          g=query-xo
-          y_query=m*g+yo
-          y_result.append(y_query)
-          break
-  return y_result
+def linear_interpolation(x,y,x_query,extrapolate=False,uniform=None):
+  x=np.asarray(x,dtype=float)
+  y=np.asarray(y,dtype=float)
+  m=np.diff(y)/np.diff(x)#slope of every interval
+  return evaluate_piecewise(x,np.vstack([m,y[:-1]]),x_query,extrapolate,uniform=uniform)
     
    
 def visualize(x,y,x_query,y_result):
+    import matplotlib.pyplot as plt
     plt.plot(x,y,'ko',label="Data points")
     plt.plot(x_query,y_result,'r-',label="interpolated point")
     plt.title("Linear Spline Interpolation")
@@ -0,0 +1,255 @@
+"""
+======================================================================
+Out-of-Core Interpolation over Memory-Mapped Tables
+----------------------------------------------------------------------
+
+Overview:
+---------
+linear_interpolation(x, y, x_query) and my_cubic_spline_flat() work on
+the whole table in memory: converting x and y to arrays, computing
+every slope, solving the full spline system. For a calibration table
+with hundreds of millions of rows on disk that means reading all of it
+for every call, however few queries there are.
+
+The interpolators here keep x and y as they are given, e.g. memory
+maps from np.load(path, mmap_mode="r") or np.memmap, and only touch
+the rows the queries need:
+
+1. Queries are processed in chunks (sorted within the chunk, and put
+   back in their original order at the end).
+2. For a sorted chunk, two binary searches on x find the knot range
+   [x_a, x_b] it covers. Binary search only reads about log2(n) rows.
+3. Dense chunk (the range holds no more than a few knots per query):
+   the slice x[a:b], y[a:b] is read in one go, i.e. one contiguous run
+   of pages, and interpolated in memory with the O(n+m) merge lookup
+   of piecewise.py.
+4. Sparse chunk (queries spread thinly over a long range): the segment
+   of every query is found with a binary search on the mapped x, and
+   only the rows around each query are gathered.
+
+Either way the rows read are proportional to the number of queries,
+not to the table size, so throughput does not depend on n.
+
+Cubic splines:
+--------------
+The natural spline's M values depend on the whole table, but the
+effect of a row on M dies out by a factor of about 0.27 per row
+(h/6 against (h(i-1)+h(i))/3 in the system; at most 1/2 for badly
+graded spacing). So each dense range is extended by _PAD rows on both
+sides and solved on its own with natural ends (thomas_algorithm). On a
+sparse chunk every query gets its own window of 2*_PAD+2 rows, and all
+windows are solved together with batched_thomas_solve. Windows that
+reach a table end start or stop exactly there, so the real natural
+boundary condition is kept. The result matches the spline of the
+whole table to ~1e-12 relative or better.
+
+Classes():
+----------------
+1. MappedLinearInterpolator(x, y, extrapolate=False, uniform=False, chunk=65536)
+2. MappedCubicSpline(x, y, extrapolate=False, uniform=False, chunk=65536)
+    - interp(X)            values at X (any order, result shaped like X)
+    - interp.stream(batches) generator, one result per batch of queries
+    - interp.rows_read     rows of x and y read by slices and gathers
+                           so far (binary searches add ~log2(n) each)
+
+Functions():
+----------------
+open_mapped_table(x_path, y_path):
+    Opens two .npy files as read-only memory maps, returns (x, y).
+
+Notes:
+------
+- x must be strictly increasing. This is not checked, since checking
+  would read the whole table.
+- uniform=True declares x evenly spaced. The segment of a query is
+  then computed from x[0], x[-1] and n, without any binary search.
+- Queries outside [x[0], x[-1]] raise ValueError unless
+  extrapolate=True, in which case the end pieces are continued.
+- Binary searches run in the table's own dtype (queries are cast and
+  the rounding corrected), so a float32 table is never converted as a
+  whole. Rows are converted to float64 after they are read.
+
+======================================================================
+"""
+
+
+import numpy as np
+from spline_interpolation.piecewise import evaluate_piecewise,_is_sorted
+from spline_interpolation.cubic_spline_with_thomas_alg import cubic_coefficients
+from linear_algebra.thomas_algorithm import thomas_algorithm,batched_thomas_solve
+
+_CHUNK=1<<16#queries per chunk
+_MIN_WINDOW=1<<12#rows always worth reading as one slice (a few pages)
+_ROWS_PER_QUERY=8#denser than this, read the covered slice instead of gathering
+_PAD=48#extra rows on each side of a local cubic solve
+_WINDOW_BLOCK=2048#local cubic systems solved per batch on sparse chunks
+
+def open_mapped_table(x_path,y_path):
+    return np.load(x_path,mmap_mode="r"),np.load(y_path,mmap_mode="r")
+
+class _MappedTable:
+    _pad=0#rows of context each side of a dense range
+
+    def __init__(self,x,y,extrapolate=False,uniform=False,chunk=_CHUNK):
+        if not isinstance(x,np.ndarray):
+            x=np.asarray(x,dtype=float)
+        if not isinstance(y,np.ndarray):
+            y=np.asarray(y,dtype=float)
+        if x.ndim!=1 or x.shape!=y.shape or len(x)<2:
+            raise ValueError("x and y must be 1-D with the same length of at least 2")
+        self.x=x#kept as given: a memmap stays a memmap
+        self.y=y
+        self.n=len(x)
+        self.x0=float(x[0])
+        self.xn=float(x[-1])
+        self.extrapolate=bool(extrapolate)
+        self.uniform=bool(uniform)
+        self.chunk=int(chunk)
+        self.rows_read=0
+
+    def _read(self,a,b):
+        self.rows_read+=b-a
+        return np.asarray(self.x[a:b],dtype=float),np.asarray(self.y[a:b],dtype=float)
+
+    def _gather(self,idx):
+        self.rows_read+=idx.size
+        return np.asarray(self.x[idx],dtype=float),np.asarray(self.y[idx],dtype=float)
+
+    def _segments(self,Xs):
+        n=self.n
+        if self.uniform:#clipped as floats, a far query would overflow intp
+            t=np.clip((Xs-self.x0)*((n-1)/(self.xn-self.x0)),0,n-2)
+            return np.where(np.isnan(t),n-2,t).astype(np.intp)
+        i=self._search(Xs)
+        return np.clip(i,0,n-2,out=i)
+
+    def _search(self,Xs):
+        #index of the last row with x <= X. searchsorted converts the whole
+        #table when the dtypes differ, so the queries are cast to x.dtype
+        #instead and the rounding is corrected afterwards
+        if self.x.dtype==Xs.dtype or self.x.dtype.kind not in "fiu":
+            return np.searchsorted(self.x,Xs,side="right")-1
+        i=np.searchsorted(self.x,Xs.astype(self.x.dtype),side="right")-1
+        #a query that rounded up onto a row counts that row: step back once
+        #(rounding down cannot skip a row, that row would be the closer value)
+        hit=np.flatnonzero(i>=0)
+        over=hit[self.x[i[hit]]>Xs[hit]]
+        i[over]-=1
+        return i
+
+    def _dense_range(self,Xs):
+        #row range [a, b) covering the sorted chunk Xs, or None when it is too sparse
+        ends=self._segments(Xs[[0,-1]])
+        a=max(int(ends[0])-self._pad,0)
+        b=min(int(ends[1])+2+self._pad,self.n)
+        if b-a<=_ROWS_PER_QUERY*len(Xs)+_MIN_WINDOW:
+            return a,b
+        return None
+
+    def __call__(self,X,extrapolate=None):
+        if extrapolate is None:
+            extrapolate=self.extrapolate
+        X=np.asarray(X,dtype=float)
+        shape=X.shape
+        X=X.ravel()
+        if X.size and not extrapolate and (X.min()<self.x0 or X.max()>self.xn):
+            raise ValueError("x_query is out of the interpolation range")
+
+        S=np.empty(len(X))
+        for s in range(0,len(X),self.chunk):
+            Xc=X[s:s+self.chunk]
+            if _is_sorted(Xc):
+                S[s:s+self.chunk]=self._sorted(Xc)
+            else:
+                order=np.argsort(Xc,kind="stable")
+                S[s:s+self.chunk][order]=self._sorted(Xc[order])
+        return S.reshape(shape)
+
+    def stream(self,batches,extrapolate=None):
+        for X in batches:
+            yield self(X,extrapolate)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(rows={self.n}, domain=[{self.x0:g}, {self.xn:g}])"
+
+class MappedLinearInterpolator(_MappedTable):
+    def _sorted(self,Xs):
+        r=self._dense_range(Xs)
+        if r is not None:
+            xw,yw=self._read(*r)
+            c=np.vstack([np.diff(yw)/np.diff(xw),yw[:-1]])
+            return evaluate_piecewise(xw,c,Xs,True,assume_sorted=True,uniform=self.uniform or None)
+        i=self._segments(Xs)
+        xw,yw=self._gather(np.stack([i,i+1]))
+        return yw[0]+(yw[1]-yw[0])/(xw[1]-xw[0])*(Xs-xw[0])
+
+class MappedCubicSpline(_MappedTable):
+    _pad=_PAD
+
+    def _sorted(self,Xs):
+        r=self._dense_range(Xs)
+        if r is not None:
+            xw,yw=self._read(*r)
+            M=np.asarray(thomas_algorithm(xw,yw,self.uniform))
+            c=cubic_coefficients(xw,yw,M)
+            return evaluate_piecewise(xw,c,Xs,True,assume_sorted=True,uniform=self.uniform or None)
+
+        #sparse: one local window per distinct start row, solved in batches
+        w=min(2*_PAD+2,self.n)
+        i=self._segments(Xs)
+        start=np.clip(i-_PAD,0,self.n-w)
+        starts,which=np.unique(start,return_inverse=True)
+        S=np.empty(len(Xs))
+        for s in range(0,len(starts),_WINDOW_BLOCK):
+            block=starts[s:s+_WINDOW_BLOCK]
+            xw,yw=self._gather(block[:,None]+np.arange(w))#(windows, w)
+            h=np.diff(xw,axis=1)
+            M=np.zeros(xw.shape)
+            if w>2:
+                sl=np.diff(yw,axis=1)/h
+                M[:,1:-1]=batched_thomas_solve(h[:,1:-1]/6.0,(h[:,:-1]+h[:,1:])/3.0,
+                                               h[:,1:-1]/6.0,np.diff(sl,axis=1))
+            q=np.flatnonzero((which>=s)&(which<s+len(block)))
+            row=which[q]-s
+            k=i[q]-block[row]#segment inside the window
+            hk=h[row,k]
+            A=(xw[row,k+1]-Xs[q])/hk
+            B=1.0-A
+            S[q]=(A*yw[row,k]+B*yw[row,k+1]
+                  +((A**3-A)*M[row,k]+(B**3-B)*M[row,k+1])*hk*hk/6.0)
+        return S
+
+def run_mapped_tables():
+    import os
+    import tempfile
+    import time
+    with tempfile.TemporaryDirectory() as tmp:
+        #float32 only has 2^24 steps per binade, so its table is shorter and coarser
+        for dtype,n,step in ((np.float64,20_000_000,1e-5),(np.float32,4_000_000,1e-3)):
+            xp,yp=os.path.join(tmp,"x.npy"),os.path.join(tmp,"y.npy")
+            x=np.lib.format.open_memmap(xp,mode="w+",dtype=dtype,shape=(n,))
+            y=np.lib.format.open_memmap(yp,mode="w+",dtype=dtype,shape=(n,))
+            for s in range(0,n,1<<22):#written in blocks, never whole in memory
+                t=np.arange(s,min(s+(1<<22),n))*step
+                x[s:s+len(t)]=t+0.01*step*np.sin(t)
+                y[s:s+len(t)]=np.sin(x[s:s+len(t)].astype(float))
+            x.flush()
+            y.flush()
+            del x,y
+
+            x,y=open_mapped_table(xp,yp)
+            span=float(x[-1])/20
+            rng=np.random.default_rng(0)
+            batches=[np.sort(rng.uniform(span*b,span*b+span/10,100_000)) for b in range(5)]
+            batches.append(rng.uniform(float(x[0]),float(x[-1]),100_000))#scattered, unsorted
+            for kind in (MappedLinearInterpolator,MappedCubicSpline):
+                interp=kind(x,y)
+                t0=time.perf_counter()
+                #float32 y carries ~6e-8 rounding of its own
+                err=max(np.max(np.abs(S-np.sin(X))) for X,S in zip(batches,interp.stream(batches)))
+                print(f"{np.dtype(dtype).name} {interp!r}: {time.perf_counter()-t0:.3f} s, "
+                      f"rows read {interp.rows_read} of {n}, max error {err:.2e}")
+            del x,y
+
+if __name__=="__main__":
+    run_mapped_tables()
@@ -0,0 +1,128 @@
+"""
+======================================================================
+Interval Lookup and Piecewise Polynomial Evaluation
+----------------------------------------------------------------------
+
+Overview:
+---------
+Every spline in this folder is a piecewise polynomial: on the segment
+[x_i, x_(i+1)] it is
+
+    S(X) = c[0,i]*t^k + c[1,i]*t^(k-1) + ... + c[k,i]      t = X - x_i
+
+Evaluating it at many query points has two parts, and both used to be
+a Python loop over every segment for every query (O(n*m)):
+
+1. Finding the segment i of each query.
+2. Evaluating the polynomial of that segment.
+
+This module does both for the whole query array at once.
+
+Interval lookup:
+----------------
+- Uniform knots (x_i = x_0 + i*h, detected or declared): the segment
+  is floor((X - x_0)/h), plain arithmetic, O(1) per query and no
+  memory traffic into the knot array at all.
+- Unsorted queries: one binary search per query (np.searchsorted),
+  O(m log n).
+- Sorted queries: a merge of the two sorted lists. Every interior knot
+  finds where it falls among the queries (n binary searches over the
+  queries), and a running count of knots at or before each query is its
+  segment index, so the cost is O(n log m + m), i.e. linear when there
+  are more queries than knots. This is also much more cache friendly
+  than m random binary searches into a large knot array.
+
+A query equal to a knot x_i belongs to segment i (the last knot belongs
+to the last segment), so the result is continuous either way.
+
+Evaluation:
+-----------
+The polynomial is evaluated with Horner's rule over chunks of queries,
+so the temporaries stay small and in cache even for 10^7 queries.
+
+Functions():
+----------------
+1. find_intervals(x, X, extrapolate=False, assume_sorted=None, uniform=None):
+    Segment index (0..n-2) of every query X. Raises ValueError for
+    queries outside [x[0], x[-1]] unless extrapolate=True, in which
+    case they get the first or last segment.
+
+2. evaluate_piecewise(x, coeffs, X, extrapolate=False, assume_sorted=None, uniform=None):
+    Evaluates the piecewise polynomial with coefficient array
+    coeffs (shape (k+1, n-1), highest power first) at X.
+
+3. is_uniform(x, rtol=1e-9):
+    True when all knot spacings agree to rtol.
+
+Notes:
+------
+- x must be strictly increasing.
+- assume_sorted=None checks whether X is sorted (one O(m) pass) and
+  picks the merge path when it is.
+- uniform=None checks the knots (one O(n) pass); pass True to declare
+  equal spacing or False to skip the check.
+- Results have the shape of X. A NaN query gets the last segment on
+  every path (and so evaluates to NaN).
+
+======================================================================
+"""
+
+
+import numpy as np
+
+_CHUNK=1<<16#queries per Horner pass
+
+def _is_sorted(X):
+    return X.ndim==1 and bool(np.all(X[1:]>=X[:-1]))
+
+def is_uniform(x,rtol=1e-9):
+    h=np.diff(np.asarray(x,dtype=float))
+    return len(h)>0 and bool(np.ptp(h)<=rtol*abs(h[0]))
+
+def find_intervals(x,X,extrapolate=False,assume_sorted=None,uniform=None):
+    x=np.asarray(x,dtype=float)
+    X=np.asarray(X,dtype=float)
+    n=len(x)
+    if n<2:
+        raise ValueError("need at least two knots")
+    if uniform is None:
+        uniform=is_uniform(x)
+    if assume_sorted is None and not uniform:
+        assume_sorted=_is_sorted(X)
+
+    if X.size and not extrapolate:
+        lo,hi=(X[0],X[-1]) if assume_sorted else (X.min(),X.max())
+        if lo<x[0] or hi>x[-1]:
+            raise ValueError("x_query is out of the interpolation range")
+
+    if uniform:
+        #equal spacing: the segment is an arithmetic index, O(1) per query
+        #clipped as floats: a far query would overflow intp before clipping;
+        #NaN goes to the last segment like searchsorted (its value is NaN anyway)
+        t=np.clip((X-x[0])*((n-1)/(x[-1]-x[0])),0,n-2)
+        return np.where(np.isnan(t),n-2,t).astype(np.intp)
+    if assume_sorted and X.ndim==1 and len(X)>=n:
+        #merge path: segment index = number of interior knots <= query
+        first=np.searchsorted(X,x[1:-1],side="left")
+        return np.cumsum(np.bincount(first,minlength=len(X)+1)[:len(X)])
+    i=np.searchsorted(x,X,side="right")-1
+    return np.clip(i,0,n-2,out=i)
+
+def evaluate_piecewise(x,coeffs,X,extrapolate=False,assume_sorted=None,uniform=None):
+    x=np.asarray(x,dtype=float)
+    coeffs=np.asarray(coeffs,dtype=float)
+    X=np.asarray(X,dtype=float)
+    shape=X.shape
+    X=X.ravel()
+    i=find_intervals(x,X,extrapolate,assume_sorted,uniform)
+
+    S=np.empty(len(X))
+    for s in range(0,len(X),_CHUNK):
+        idx=i[s:s+_CHUNK]
+        out=S[s:s+_CHUNK]
+        t=X[s:s+_CHUNK]-x[idx]
+        out[...]=coeffs[0,idx]
+        for c in coeffs[1:]:
+            out*=t
+            out+=c[idx]
+    return S.reshape(shape)
@@ -14,23 +14,28 @@ They ensure:
 - A simple boundary condition (c₀ = 0) helps uniquely define the curve
 
 What This Script Does:
-- Symbolically constructs spline equations for all intervals
-- Automatically solves the system using SymPy
+- Solves for the coefficients numerically in O(n): with c₀ = 0 the
+  conditions reduce to the recurrence bᵢ₊₁ = 2sᵢ - bᵢ (sᵢ = slope of
+  interval i), after which cᵢ = (sᵢ - bᵢ)/hᵢ
+- quadratic_spline(x, y, x_query, exact=True) instead symbolically
+  constructs the spline equations for all intervals and solves them
+  with SymPy (slow, only for small data sets)
+- extrapolate=True continues the end pieces outside [x₀, xₙ]
 - Evaluates interpolated values at any query points
 - Visualizes the data, interpolated curve, and smooth transitions using Matplotlib
 
 Features:
 - Educational and transparent spline construction
 - Continuity of the first derivative for a smooth curve
-- Precise and symbolic solution (great for learning)
+- Optional symbolic solution (great for learning)
 - Clear visual representation of both raw and interpolated data
 - Handles interpolation domain errors correctly
 
 """
-from sympy import symbols,Eq, solve
-import matplotlib.pyplot as plt
 import numpy as np
-def quadratic_spline(x,y,x_query): 
+from spline_interpolation.piecewise import evaluate_piecewise
+def _quadratic_spline_exact(x,y,x_query): 
+   from sympy import symbols,Eq,solve#loaded only when a spline is fitted
    n=len(x)-1#  n segments
    b=symbols(f"b0:{n}")
    c=symbols(f"c0:{n}")
@@ -76,7 +81,30 @@ def quadratic_spline(x,y,x_query):
          raise ValueError("interpolation interval was not found for x_query")
    return y_query
 
+def quadratic_coefficients(x,y):
+   #c0=0 gives b0=s0, then slope continuity b(i+1)=b(i)+2*c(i)*h(i)
+   #with c(i)=(s(i)-b(i))/h(i) reduces to b(i+1)=2*s(i)-b(i)
+   x=np.asarray(x,dtype=float)
+   y=np.asarray(y,dtype=float)
+   h=np.diff(x)
+   s=np.diff(y)/h
+   sign=np.ones(len(s))
+   sign[1::2]=-1
+   #u(i)=(-1)^i*b(i) turns the recurrence into u(i+1)=u(i)-(-1)^i*2*s(i), a cumsum
+   u=np.empty(len(s))
+   u[0]=s[0]
+   u[1:]=s[0]-np.cumsum(2*s[:-1]*sign[:-1])
+   b=u*sign
+   c=(s-b)/h
+   return np.vstack([c,b,y[:-1]])
+
+def quadratic_spline(x,y,x_query,exact=False,extrapolate=False,uniform=None):
+   if exact:
+      return _quadratic_spline_exact(x,y,x_query)
+   return evaluate_piecewise(x,quadratic_coefficients(x,y),x_query,extrapolate,uniform=uniform)
+
 def visualize(x,y,x_query,y_query):
+    import matplotlib.pyplot as plt
     plt.title("Quadratic Spline Interpolation")
     plt.plot(x,y,'ko',label='Data points')
     plt.plot(x_query,y_query,'r-',label="interpolated point")
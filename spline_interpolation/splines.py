@@ -0,0 +1,257 @@
+"""
+======================================================================
+Fitted Spline Objects
+----------------------------------------------------------------------
+
+Overview:
+---------
+linear_interpolation, quadratic_spline and my_cubic_spline_flat fit
+and evaluate in one call, so querying the same curve again re-solves
+the whole system. The classes here fit once and keep only the result:
+
+    x       knots, shape (n,)
+    c       per-segment coefficients, shape (k+1, n-1), highest power
+            first, in the local variable t = X - x_i:
+
+                S(X) = c[0,i]*t^k + ... + c[k-1,i]*t + c[k,i]
+
+That is (k+2)*n floats in total, and every operation below works
+directly on it:
+
+- evaluation        : vectorized interval lookup + Horner (piecewise.py),
+                      evenly spaced knots are detected once at
+                      construction and use the O(1) arithmetic lookup
+- derivative        : multiply each row by its power, drop the last row
+- antiderivative    : divide each row by its new power, then fix the
+                      constant of every segment so the result is
+                      continuous (running sum of the segment integrals)
+- definite integral : F(b) - F(a) with the antiderivative F, exact
+- roots             : eigenvalues of the companion matrix of every
+                      segment at once, keeping the real ones that fall
+                      inside their own segment
+- save / load       : np.savez of x and c (plus the class name), so a
+                      curve fitted once can be reused by other programs
+                      (".npz" is added to the path when missing, by
+                      both methods)
+- derivatives and the antiderivative are built on first use and kept,
+  so spline(X, nu=1) or integrate(a, b) in a loop costs evaluation
+  only
+
+Classes():
+----------------
+1. PiecewisePolynomial(x, c, extrapolate=False):
+    Base class holding x and c. derivative() and antiderivative()
+    return PiecewisePolynomial objects.
+
+2. LinearSpline(x, y, extrapolate=False):
+    Straight lines between the data points (degree 1).
+
+3. QuadraticSpline(x, y, extrapolate=False):
+    Quadratic spline with c0 = 0, same as quadratic_spline().
+
+4. CubicSpline(x, y, boundary="natural", extrapolate=False):
+    Cubic spline from the Thomas algorithm, "natural" or "periodic",
+    same as my_cubic_spline_flat().
+
+Methods:
+--------
+- spline(X, nu=0):        value (or nu-th derivative) at X
+- spline.derivative(nu):  new piecewise polynomial of degree k-nu
+- spline.integrate(a, b): definite integral, a and b may be arrays
+- spline.roots():         sorted real X with spline(X) == 0
+- spline.save(path) / PiecewisePolynomial.load(path)
+
+Notes:
+------
+- Queries outside [x0, xn] raise ValueError unless extrapolate=True,
+  in which case the end pieces are continued.
+- roots() skips segments that are identically zero.
+- load() returns an object of the class that was saved.
+
+======================================================================
+"""
+
+
+import os
+import numpy as np
+from spline_interpolation.piecewise import evaluate_piecewise,is_uniform
+from spline_interpolation.quadratic_splines import quadratic_coefficients
+from spline_interpolation.cubic_spline_with_thomas_alg import (cubic_coefficients,
+    periodic_thomas_algorithm)
+from linear_algebra.thomas_algorithm import thomas_algorithm
+
+_ROOT_TOL=1e-10#relative tolerance for "inside the segment"
+_IMAG_TOL=1e-7#eigenvalues of a double root carry ~sqrt(eps) imaginary noise
+
+def _npz_path(path):
+    #np.savez appends ".npz" to a name without it, so load must do the same
+    path=os.fspath(path)
+    return path if path.endswith(".npz") else path+".npz"
+
+class PiecewisePolynomial:
+    _kinds={}
+
+    def __init_subclass__(cls,**kwargs):
+        super().__init_subclass__(**kwargs)
+        PiecewisePolynomial._kinds[cls.__name__]=cls
+
+    def __init__(self,x,c,extrapolate=False):
+        self.x=np.ascontiguousarray(x,dtype=float)
+        self.c=np.ascontiguousarray(c,dtype=float)
+        self.extrapolate=bool(extrapolate)
+        if self.x.ndim!=1 or len(self.x)<2:
+            raise ValueError("x must be 1-D with at least two knots")
+        if np.any(np.diff(self.x)<=0):
+            raise ValueError("x must be strictly increasing")
+        if self.c.ndim!=2 or self.c.shape[1]!=len(self.x)-1:
+            raise ValueError("c must have shape (degree+1, len(x)-1)")
+        self.uniform=is_uniform(self.x)#checked once, not on every call
+        self._derived={}#derivatives (by nu) and the antiderivative, built once
+
+    def _sibling(self,c):
+        #same knots, new coefficients: skips the O(n) knot checks
+        obj=PiecewisePolynomial.__new__(PiecewisePolynomial)
+        obj.x=self.x
+        obj.c=np.ascontiguousarray(c,dtype=float)
+        obj.extrapolate=self.extrapolate
+        obj.uniform=self.uniform
+        obj._derived={}
+        return obj
+
+    @property
+    def degree(self):
+        return self.c.shape[0]-1
+
+    def __call__(self,X,nu=0,extrapolate=None):
+        p=self.derivative(nu) if nu else self
+        if extrapolate is None:
+            extrapolate=self.extrapolate
+        return evaluate_piecewise(p.x,p.c,X,extrapolate,uniform=self.uniform)
+
+    def derivative(self,nu=1):
+        if nu==0:
+            return self
+        if nu not in self._derived:
+            c=self.c
+            for _ in range(nu):
+                k=c.shape[0]-1
+                if k==0:
+                    c=np.zeros_like(c)
+                    break
+                c=c[:-1]*np.arange(k,0,-1)[:,None]
+            self._derived[nu]=self._sibling(c)
+        return self._derived[nu]
+
+    def antiderivative(self):
+        if "integral" not in self._derived:
+            self._derived["integral"]=self._antiderivative()
+        return self._derived["integral"]
+
+    def _antiderivative(self):
+        k=self.degree
+        h=np.diff(self.x)
+        c=np.zeros((k+2,len(h)))
+        c[:-1]=self.c/np.arange(k+1,0,-1)[:,None]
+        #value at the right end of every segment (constant term still 0)
+        full=np.zeros(len(h))
+        for row in c[:-1]:
+            full+=row
+            full*=h
+        c[-1,1:]=np.cumsum(full[:-1])
+        return self._sibling(c)
+
+    def integrate(self,a,b):
+        F=self.antiderivative()
+        return F(b)-F(a)
+
+    def roots(self):
+        h=np.diff(self.x)
+        found=[]
+        c=self.c
+        scale=np.max(np.abs(c),axis=0)
+        nonzero=np.abs(c)>_ROOT_TOL*np.where(scale>0,scale,1)
+        #effective degree of every segment = k - index of its first nonzero coefficient
+        lead=np.argmax(nonzero,axis=0)
+        live=nonzero.any(axis=0)#all-zero segments have no isolated roots
+        deg=np.where(live,self.degree-lead,0)
+
+        for d in range(1,self.degree+1):
+            seg=np.flatnonzero(deg==d)
+            if len(seg)==0:
+                continue
+            p=c[self.degree-d:,seg]/c[self.degree-d,seg]#monic, shape (d+1, m)
+            if d==1:
+                t=-p[1:2].T
+            else:
+                companion=np.zeros((len(seg),d,d))
+                companion[:,0,:]=-p[1:].T
+                companion[:,np.arange(1,d),np.arange(d-1)]=1.0
+                t=np.linalg.eigvals(companion)
+            t=np.asarray(t)
+            hs=h[seg][:,None]
+            ok=np.abs(t.imag)<=_IMAG_TOL*np.maximum(1.0,np.abs(t)) if np.iscomplexobj(t) else np.ones(t.shape,bool)
+            t=t.real
+            ok&=(t>=-_ROOT_TOL*hs)&(t<=hs*(1+_ROOT_TOL))
+            found.append((self.x[seg][:,None]+np.clip(t,0,hs))[ok])
+
+        if not found:
+            return np.zeros(0)
+        r=np.sort(np.concatenate(found))
+        #a root on a knot is found by both neighbouring segments
+        keep=np.ones(len(r),dtype=bool)
+        keep[1:]=np.diff(r)>_ROOT_TOL*max(1.0,np.max(np.abs(self.x)))
+        return r[keep]
+
+    def save(self,path):
+        np.savez(_npz_path(path),x=self.x,c=self.c,extrapolate=self.extrapolate,kind=type(self).__name__)
+
+    @classmethod
+    def load(cls,path):
+        with np.load(_npz_path(path)) as f:
+            kind=PiecewisePolynomial._kinds.get(str(f["kind"]),PiecewisePolynomial)
+            obj=kind.__new__(kind)
+            PiecewisePolynomial.__init__(obj,f["x"],f["c"],bool(f["extrapolate"]))
+        return obj
+
+    @property
+    def nbytes(self):
+        return self.x.nbytes+self.c.nbytes
+
+    def __repr__(self):
+        return f"{type(self).__name__}(degree={self.degree}, segments={self.c.shape[1]}, domain=[{self.x[0]:g}, {self.x[-1]:g}])"
+
+class LinearSpline(PiecewisePolynomial):
+    def __init__(self,x,y,extrapolate=False):
+        x=np.asarray(x,dtype=float)
+        y=np.asarray(y,dtype=float)
+        super().__init__(x,np.vstack([np.diff(y)/np.diff(x),y[:-1]]),extrapolate)
+
+class QuadraticSpline(PiecewisePolynomial):
+    def __init__(self,x,y,extrapolate=False):
+        super().__init__(x,quadratic_coefficients(x,y),extrapolate)
+
+class CubicSpline(PiecewisePolynomial):
+    def __init__(self,x,y,boundary="natural",extrapolate=False):
+        if boundary=="natural":
+            M=thomas_algorithm(x,y)
+        elif boundary=="periodic":
+            M=periodic_thomas_algorithm(x,y)
+        else:
+            raise ValueError("boundary must be 'natural' or 'periodic'")
+        super().__init__(x,cubic_coefficients(x,y,M),extrapolate)
+
+def run_splines():
+    x=np.linspace(0.0,2.8,15)
+    y=[10.0, 11.216, 11.728, 11.632, 11.024,
+       10.0, 8.656, 7.088, 5.392, 3.664,
+       2.0 , 0.496, -0.752, -1.648, -2.096]
+    s=CubicSpline(x,y)
+    print(s)
+    print(f"S(1.3)            : {float(s(1.3)):.6f}")
+    print(f"S'(1.3)           : {float(s(1.3,nu=1)):.6f}")
+    print(f"integral 0..2.8   : {float(s.integrate(0.0,2.8)):.6f}")
+    print(f"roots             : {s.roots()}")
+    print(f"stationary points : {s.derivative().roots()}")
+
+if __name__=="__main__":
+    run_splines()